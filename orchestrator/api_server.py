@@ -3,17 +3,23 @@
 
 import os
 import json
-from typing import Dict, Any, Optional, Union, List
+import logging
+import threading
+from typing import Dict, Any, Optional, Union, List, Literal
 from datetime import datetime
 from pathlib import Path
 
 from fastapi import FastAPI, HTTPException, BackgroundTasks
+from fastapi.concurrency import run_in_threadpool
 from fastapi.middleware.cors import CORSMiddleware
 from fastapi.responses import FileResponse, JSONResponse
 from pydantic import BaseModel
 
 from orchestrator import QueryOrchestrator
 
+# Setup logging
+logging.basicConfig(level=logging.INFO)
+
 # Request/Response models
 class QueryRequest(BaseModel):
     query: str
@@ -55,6 +61,20 @@ app.add_middleware(
 # Global orchestrator instance
 orchestrator = None
 
+# Serializes queries and metadata refreshes now that both run in the threadpool,
+# so a query never sees a half-rebuilt system prompt or validator
+_orchestrator_lock = threading.Lock()
+
+def _process_query_locked(query: str) -> Dict[str, Any]:
+    """Run one orchestrator call at a time; called from the threadpool."""
+    with _orchestrator_lock:
+        return orchestrator.process_query(query)
+
+def _refresh_metadata_locked() -> Dict[str, Any]:
+    """Run one orchestrator call at a time; called from the threadpool."""
+    with _orchestrator_lock:
+        return orchestrator.refresh_cube_metadata()
+
 @app.on_event("startup")
 async def startup_event():
     """Initialize orchestrator on startup"""
@@ -152,7 +172,7 @@ async def process_query(request: QueryRequest):
         print(f"🔍 API DEBUG: Received query request: {request.query}")
         # Process the query
         print("🔍 API DEBUG: Calling orchestrator.process_query...")
-        result = orchestrator.process_query(request.query)
+        result = await run_in_threadpool(_process_query_locked, request.query)
         print(f"🔍 API DEBUG: Orchestrator result success: {result.get('success', False)}")
         print(f"🔍 API DEBUG: Orchestrator result type: {result.get('response_type', 'unknown')}")
 
@@ -289,13 +309,13 @@ async def clear_conversation():
         raise HTTPException(status_code=500, detail=f"Error clearing conversation: {str(e)}")
 
 @app.get("/status")
-async def get_status():
-    """Get orchestrator status"""
+async def get_status(depth: Literal["shallow", "full"] = "shallow"):
+    """Get orchestrator status (use depth=full to include conversation and CUBE connectivity)"""
     if not orchestrator:
         raise HTTPException(status_code=503, detail="Orchestrator not initialized")
 
     try:
-        return orchestrator.get_status()
+        return orchestrator.get_status(depth=depth)
     except Exception as e:
         raise HTTPException(status_code=500, detail=f"Error getting status: {str(e)}")
 
@@ -310,13 +330,15 @@ async def refresh_metadata():
 
     try:
         print("🔄 API: Metadata refresh requested")
-        result = orchestrator.refresh_cube_metadata()
+        # The refresh does blocking HTTP and prompt regeneration; keep it off the event loop
+        result = await run_in_threadpool(_refresh_metadata_locked)
 
         if result["success"]:
             print(f"✅ API: Metadata refreshed successfully")
             return {
                 "success": True,
                 "message": "Cube metadata refreshed successfully",
+                "unchanged": result.get("unchanged", False),
                 "metadata_summary": result.get("metadata_summary"),
                 "system_prompt_metadata": result.get("system_prompt_metadata"),
                 "timestamp": result.get("timestamp")
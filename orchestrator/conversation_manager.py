@@ -1,7 +1,8 @@
 # ABOUTME: Manages conversation history and message formatting for LLM interactions
 # ABOUTME: Tracks last 6 messages and formats them for OpenAI API compatibility
 
-from typing import List, Dict, Any, Optional
+from collections import deque
+from typing import Deque, List, Dict, Any, Optional
 from datetime import datetime
 import json
 
@@ -20,7 +21,8 @@ class ConversationManager:
             max_messages: Maximum number of messages to keep in history (default: 6)
         """
         self.max_messages = max_messages
-        self.conversation_history: List[Dict[str, Any]] = []
+        # Bounded ring buffer: appending past max_messages drops the oldest message
+        self.conversation_history: Deque[Dict[str, Any]] = deque(maxlen=max_messages)
 
     def add_user_message(self, message: str, timestamp: Optional[str] = None) -> None:
         """
@@ -40,7 +42,6 @@ class ConversationManager:
         }
 
         self.conversation_history.append(user_message)
-        self._trim_history()
 
     def add_assistant_message(self, llm_response: Dict[str, Any], timestamp: Optional[str] = None) -> None:
         """
@@ -71,7 +72,6 @@ class ConversationManager:
         }
 
         self.conversation_history.append(assistant_message)
-        self._trim_history()
 
     def get_openai_messages(self, system_prompt: str) -> List[Dict[str, str]]:
         """
@@ -112,7 +112,7 @@ class ConversationManager:
 
     def clear_conversation(self) -> None:
         """Clear all conversation history."""
-        self.conversation_history = []
+        self.conversation_history.clear()
 
     def export_conversation(self) -> List[Dict[str, Any]]:
         """
@@ -121,7 +121,7 @@ class ConversationManager:
         Returns:
             Complete conversation history
         """
-        return self.conversation_history.copy()
+        return list(self.conversation_history)
 
     def import_conversation(self, history: List[Dict[str, Any]]) -> None:
         """
@@ -130,7 +130,7 @@ class ConversationManager:
         Args:
             history: Conversation history to import
         """
-        self.conversation_history = history[-self.max_messages:] if history else []
+        self.conversation_history = deque(history or (), maxlen=self.max_messages)
 
     def get_last_cube_query(self) -> Optional[Dict[str, Any]]:
         """
@@ -168,11 +168,6 @@ class ConversationManager:
 
         return list(set(topics))  # Remove duplicates
 
-    def _trim_history(self) -> None:
-        """Keep only the last max_messages in history."""
-        if len(self.conversation_history) > self.max_messages:
-            self.conversation_history = self.conversation_history[-self.max_messages:]
-
     def _generate_summary(self) -> str:
         """
         Generate a brief summary of the conversation.
@@ -3,11 +3,10 @@
 
 import requests
 import json
-import pandas as pd
 from datetime import datetime, timedelta
 from typing import Dict, List, Any, Optional
 import os
-import jwt
+import time
 
 
 class CubeClient:
@@ -31,10 +30,18 @@ class CubeClient:
         self.base_url = base_url
         self.api_secret = api_secret
         self.jwt_token = None
+        # Expiry (epoch seconds) of jwt_token; the token is reused until close to it
+        self._jwt_expires_at: Optional[int] = None
+        self.jwt_refresh_margin = 3600
         self.results_dir = results_dir
         self.session = requests.Session()
         self.session.headers.update({'Content-Type': 'application/json'})
 
+        # Cached result of the last connectivity probe, reused by status checks
+        self.connection_check_ttl = 30.0
+        self._last_connection_check: Optional[float] = None
+        self._last_connection_ok = False
+
         # Create results directory if it doesn't exist
         os.makedirs(self.results_dir, exist_ok=True)
 
@@ -195,16 +202,25 @@ class CubeClient:
         return self._validate_query(cube_query)
 
     def _get_jwt_token(self) -> bool:
-        """Generate JWT token for CUBE API authentication."""
+        """Generate JWT token for CUBE API authentication, reusing a still-valid one."""
+        if (self.jwt_token and self._jwt_expires_at is not None and
+                self._jwt_expires_at - time.time() > self.jwt_refresh_margin):
+            return True
+
         try:
             # Generate JWT token with empty payload as recommended by CUBE.js docs
             # for development environments
+            now = datetime.now()
+            expires_at = int((now + timedelta(days=30)).timestamp())
             payload = {
-                'iat': int(datetime.now().timestamp()),
-                'exp': int((datetime.now() + timedelta(days=30)).timestamp())
+                'iat': int(now.timestamp()),
+                'exp': expires_at
             }
 
+            # Imported here: PyJWT is only needed when a token has to be signed
+            import jwt
             self.jwt_token = jwt.encode(payload, self.api_secret, algorithm='HS256')
+            self._jwt_expires_at = expires_at
 
             # Update session headers with JWT token
             self.session.headers.update({
@@ -375,6 +391,8 @@ class CubeClient:
 
         # Convert to DataFrame and save
         if data:
+            # pandas is heavy to import and only needed once there are rows to write
+            import pandas as pd
             df = pd.DataFrame(data)
 
             # Clean column names - remove "ViewName." prefix
@@ -451,18 +469,27 @@ class CubeClient:
                 "error_type": "unknown_error"
             }
 
-    def get_connection_status(self) -> Dict[str, Any]:
+    def get_connection_status(self, force: bool = False) -> Dict[str, Any]:
         """
         Get current connection status.
 
+        Args:
+            force: If True, always probe the API instead of reusing a recent result
+
         Returns:
             Connection status information
         """
+        now = time.monotonic()
+        if (force or self._last_connection_check is None or
+                now - self._last_connection_check > self.connection_check_ttl):
+            self._last_connection_ok = self._test_connection()
+            self._last_connection_check = now
+
         return {
             "base_url": self.base_url,
             "has_jwt_token": self.jwt_token is not None,
             "jwt_token_preview": self.jwt_token[:20] + "..." if self.jwt_token else None,
-            "api_accessible": self._test_connection(),
+            "api_accessible": self._last_connection_ok,
             "results_directory": self.results_dir
         }
 
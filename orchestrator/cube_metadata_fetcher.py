@@ -2,13 +2,27 @@
 # ABOUTME: Provides dynamic access to measures, dimensions, and descriptions from Cube semantic layer
 
 import requests
-import json
+import orjson
 import os
+import hashlib
 from typing import Dict, List, Any, Optional
 from datetime import datetime
 from pathlib import Path
 
 
+def content_fingerprint(data: Any) -> str:
+    """
+    Compute an order-independent content hash of JSON-serializable data.
+
+    Args:
+        data: Data to fingerprint, e.g. the parsed /v1/meta response
+
+    Returns:
+        Hex digest of the data serialized with sorted keys
+    """
+    return hashlib.blake2b(orjson.dumps(data, option=orjson.OPT_SORT_KEYS), digest_size=16).hexdigest()
+
+
 class CubeMetadataFetcher:
     """
     Fetches metadata from Cube.js /v1/meta API endpoint.
@@ -18,7 +32,8 @@ class CubeMetadataFetcher:
     def __init__(self,
                  base_url: str = "http://localhost:4000",
                  jwt_token: Optional[str] = None,
-                 cache_dir: Optional[str] = None):
+                 cache_dir: Optional[str] = None,
+                 session: Optional[requests.Session] = None):
         """
         Initialize the metadata fetcher.
 
@@ -26,13 +41,21 @@ class CubeMetadataFetcher:
             base_url: Cube.js API base URL
             jwt_token: JWT token for authentication
             cache_dir: Directory to cache metadata (optional)
+            session: HTTP session to reuse for keep-alive connections (optional)
         """
         self.base_url = base_url
         self.jwt_token = jwt_token
         self.cache_dir = cache_dir
+        self.session = session or requests.Session()
         self.metadata = None
         self.metadata_timestamp = None
 
+        # Derived from metadata in a single pass whenever it is (re)loaded
+        self.views_by_name: Dict[str, Dict[str, Any]] = {}
+        self.summary: Optional[Dict[str, Any]] = None
+        # Content hash of metadata, computed once per load and shared by cache keys
+        self.metadata_fingerprint: Optional[str] = None
+
         if cache_dir:
             os.makedirs(cache_dir, exist_ok=True)
             self.cache_file = os.path.join(cache_dir, "cube_metadata.json")
@@ -52,14 +75,17 @@ class CubeMetadataFetcher:
         # Try to load from cache first if requested
         if use_cache and self.cache_file and os.path.exists(self.cache_file):
             try:
-                with open(self.cache_file, 'r', encoding='utf-8') as f:
-                    cached_data = json.load(f)
+                with open(self.cache_file, 'rb') as f:
+                    cached_data = orjson.loads(f.read())
                     self.metadata = cached_data.get('metadata')
                     self.metadata_timestamp = cached_data.get('timestamp')
+                    self._index_metadata()
                     return {
                         "success": True,
                         "source": "cache",
                         "metadata": self.metadata,
+                        "summary": self.summary,
+                        "views_by_name": self.views_by_name,
                         "timestamp": self.metadata_timestamp
                     }
             except Exception as e:
@@ -71,15 +97,16 @@ class CubeMetadataFetcher:
             if self.jwt_token:
                 headers['Authorization'] = f'Bearer {self.jwt_token}'
 
-            response = requests.get(
+            response = self.session.get(
                 f"{self.base_url}/cubejs-api/v1/meta",
                 headers=headers,
                 timeout=10
             )
             response.raise_for_status()
 
-            self.metadata = response.json()
+            self.metadata = orjson.loads(response.content)
             self.metadata_timestamp = datetime.now().isoformat()
+            self._index_metadata()
 
             # Save to cache
             if self.cache_file:
@@ -89,6 +116,8 @@ class CubeMetadataFetcher:
                 "success": True,
                 "source": "api",
                 "metadata": self.metadata,
+                "summary": self.summary,
+                "views_by_name": self.views_by_name,
                 "timestamp": self.metadata_timestamp
             }
 
@@ -114,51 +143,70 @@ class CubeMetadataFetcher:
                 "metadata": self.metadata,
                 "timestamp": self.metadata_timestamp
             }
-            with open(self.cache_file, 'w', encoding='utf-8') as f:
-                json.dump(cache_data, f, indent=2)
+            with open(self.cache_file, 'wb') as f:
+                f.write(orjson.dumps(cache_data, option=orjson.OPT_INDENT_2))
             return True
         except Exception as e:
             print(f"Warning: Failed to save metadata cache: {str(e)}")
             return False
 
-    def get_view_metadata(self, view_name: str) -> Dict[str, Any]:
+    def _index_metadata(self) -> None:
         """
-        Extract metadata for a specific view or cube.
+        Build per-view metadata and the summary in a single pass over the cubes.
+
+        When several entries share a name, views are preferred over regular cubes.
+        """
+        cubes = self.metadata.get('cubes', []) if self.metadata else []
+        targets: Dict[str, Dict[str, Any]] = {}
+        view_names = []
+        cube_names = []
+
+        for cube in cubes:
+            cube_name = cube.get('name')
+            is_view = self._is_view(cube)
+
+            if is_view:
+                view_names.append(cube_name)
+            else:
+                cube_names.append(cube_name)
+
+            current = targets.get(cube_name)
+            if current is None or (is_view and not self._is_view(current)):
+                targets[cube_name] = cube
+
+        self.views_by_name = {
+            name: self._build_view_metadata(name, cube)
+            for name, cube in targets.items()
+        }
+
+        self.summary = {
+            "success": True,
+            "total_cubes": len(cubes),
+            "views_count": len(view_names),
+            "cubes_count": len(cube_names),
+            "view_names": view_names,
+            "cube_names": cube_names,
+            "timestamp": self.metadata_timestamp
+        }
+
+        self.metadata_fingerprint = content_fingerprint(self.metadata) if self.metadata else None
+
+    @staticmethod
+    def _is_view(cube: Dict[str, Any]) -> bool:
+        """Check whether a metadata entry describes a view."""
+        return cube.get('type') == 'view' or bool(cube.get('isView'))
+
+    def _build_view_metadata(self, view_name: str, target_cube: Dict[str, Any]) -> Dict[str, Any]:
+        """
+        Convert a raw cube/view entry into structured view metadata.
 
         Args:
-            view_name: Name of the view/cube to extract
+            view_name: Name of the view/cube
+            target_cube: Raw metadata entry from the Cube API
 
         Returns:
             Dictionary with view metadata including measures and dimensions
         """
-        if not self.metadata:
-            return {
-                "success": False,
-                "error": "Metadata not loaded. Call fetch_metadata() first."
-            }
-
-        # Look for the view/cube in metadata
-        cubes = self.metadata.get('cubes', [])
-        target_cube = None
-
-        # Prefer views first
-        for cube in cubes:
-            if cube.get('name') == view_name:
-                # Check if it's a view
-                if cube.get('type') == 'view' or cube.get('isView'):
-                    target_cube = cube
-                    break
-                # Store as fallback if it's a regular cube
-                if target_cube is None:
-                    target_cube = cube
-
-        if not target_cube:
-            return {
-                "success": False,
-                "error": f"View/cube '{view_name}' not found in metadata",
-                "available_cubes": [c.get('name') for c in cubes]
-            }
-
         # Extract measures
         measures = []
         for measure in target_cube.get('measures', []):
@@ -178,18 +226,91 @@ class CubeMetadataFetcher:
                 "type": dimension.get('type', '')  # Include type for time dimension validation
             })
 
+        title = target_cube.get('title', view_name)
+        # Fields of a view share its name as prefix (EventPerformanceOverview.revenues)
+        prefix = f"{view_name}."
+        description = target_cube.get('description', '')
+
         return {
             "success": True,
             "view": view_name,
             "type": target_cube.get('type', 'cube'),
-            "title": target_cube.get('title', view_name),
-            "description": target_cube.get('description', ''),
+            "title": title,
+            "description": description,
             "measures": measures,
             "dimensions": dimensions,
             "measures_count": len(measures),
-            "dimensions_count": len(dimensions)
+            "dimensions_count": len(dimensions),
+            "validator_metadata": {
+                "name": view_name,
+                "title": title,
+                "description": description,
+                "measures": [
+                    {
+                        "name": self._strip_prefix(measure["name"], prefix),
+                        "title": measure["title"],
+                        "description": measure["description"]
+                    }
+                    for measure in measures
+                ],
+                "dimensions": [
+                    {
+                        "name": self._strip_prefix(dimension["name"], prefix),
+                        "title": dimension["title"],
+                        "description": dimension["description"],
+                        "type": dimension["type"]  # Include type for time dimension validation
+                    }
+                    for dimension in dimensions
+                ]
+            }
         }
 
+    @staticmethod
+    def _strip_prefix(field_name: Optional[str], prefix: str) -> Optional[str]:
+        """
+        Strip the cube prefix from a field name (EventPerformanceOverview.revenues -> revenues).
+
+        Args:
+            field_name: Fully qualified field name
+            prefix: Expected prefix including the trailing dot
+
+        Returns:
+            Field name without its cube prefix
+        """
+        if not field_name:
+            return field_name
+        if field_name.startswith(prefix):
+            return field_name[len(prefix):]
+        # Field from another cube: strip whatever prefix it carries
+        return field_name.partition('.')[2] or field_name
+
+    def get_view_metadata(self, view_name: str) -> Dict[str, Any]:
+        """
+        Extract metadata for a specific view or cube.
+
+        Args:
+            view_name: Name of the view/cube to extract
+
+        Returns:
+            Dictionary with view metadata including measures and dimensions
+        """
+        if not self.metadata:
+            return {
+                "success": False,
+                "error": "Metadata not loaded. Call fetch_metadata() first."
+            }
+
+        view_data = self.views_by_name.get(view_name)
+
+        if not view_data:
+            return {
+                "success": False,
+                "error": f"View/cube '{view_name}' not found in metadata",
+                "available_cubes": [c.get('name') for c in self.metadata.get('cubes', [])]
+            }
+
+        return view_data
+
     def get_all_views_metadata(self) -> Dict[str, Any]:
         """
         Extract metadata for all views and cubes.
@@ -204,13 +325,7 @@ class CubeMetadataFetcher:
             }
 
         cubes = self.metadata.get('cubes', [])
-        all_views = []
-
-        for cube in cubes:
-            cube_name = cube.get('name')
-            view_data = self.get_view_metadata(cube_name)
-            if view_data.get('success'):
-                all_views.append(view_data)
+        all_views = [self.views_by_name[cube.get('name')] for cube in cubes]
 
         return {
             "success": True,
@@ -232,19 +347,7 @@ class CubeMetadataFetcher:
                 "error": "Metadata not loaded. Call fetch_metadata() first."
             }
 
-        cubes = self.metadata.get('cubes', [])
-        views = [c for c in cubes if c.get('type') == 'view' or c.get('isView')]
-        regular_cubes = [c for c in cubes if c.get('type') != 'view' and not c.get('isView')]
-
-        return {
-            "success": True,
-            "total_cubes": len(cubes),
-            "views_count": len(views),
-            "cubes_count": len(regular_cubes),
-            "view_names": [v.get('name') for v in views],
-            "cube_names": [c.get('name') for c in regular_cubes],
-            "timestamp": self.metadata_timestamp
-        }
+        return self.summary
 
     def clear_cache(self) -> bool:
         """Clear the metadata cache file."""
@@ -253,6 +356,9 @@ class CubeMetadataFetcher:
                 os.remove(self.cache_file)
                 self.metadata = None
                 self.metadata_timestamp = None
+                self.views_by_name = {}
+                self.summary = None
+                self.metadata_fingerprint = None
                 return True
             except Exception as e:
                 print(f"Warning: Failed to clear cache: {str(e)}")
@@ -5,6 +5,13 @@ import yaml
 from typing import Dict, List, Any, Optional, Set
 from pathlib import Path
 
+# Prefer the libyaml-backed loader; fall back to the pure-Python one when
+# PyYAML was built without libyaml
+try:
+    from yaml import CSafeLoader as _YamlLoader
+except ImportError:
+    from yaml import SafeLoader as _YamlLoader
+
 
 class CubeQueryValidator:
     """
@@ -38,6 +45,9 @@ class CubeQueryValidator:
         self.available_dimensions = self._extract_dimensions()
         self.available_time_dimensions = self._extract_time_dimensions()
 
+        # Built on first request; the schema does not change after init
+        self._schema_summary: Optional[Dict[str, Any]] = None
+
     def _load_schema(self) -> Dict[str, Any]:
         """Load and parse the YML schema file (static mode only)."""
         if not self.view_yml_path:
@@ -45,7 +55,7 @@ class CubeQueryValidator:
 
         try:
             with open(self.view_yml_path, 'r', encoding='utf-8') as f:
-                content = yaml.safe_load(f)
+                content = yaml.load(f, Loader=_YamlLoader)
 
             # Handle cubes array structure
             if 'cubes' in content and isinstance(content['cubes'], list):
@@ -255,15 +265,17 @@ class CubeQueryValidator:
         Returns:
             Dictionary with schema information
         """
-        return {
-            "cube_name": self.cube_name,
-            "measures": sorted(list(self.available_measures)),
-            "dimensions": sorted(list(self.available_dimensions)),
-            "time_dimensions": sorted(list(self.available_time_dimensions)),
-            "measure_count": len(self.available_measures),
-            "dimension_count": len(self.available_dimensions),
-            "time_dimension_count": len(self.available_time_dimensions)
-        }
+        if self._schema_summary is None:
+            self._schema_summary = {
+                "cube_name": self.cube_name,
+                "measures": sorted(self.available_measures),
+                "dimensions": sorted(self.available_dimensions),
+                "time_dimensions": sorted(self.available_time_dimensions),
+                "measure_count": len(self.available_measures),
+                "dimension_count": len(self.available_dimensions),
+                "time_dimension_count": len(self.available_time_dimensions)
+            }
+        return self._schema_summary
 
     def generate_correction_prompt(self, validation_result: Dict[str, Any], original_query: str) -> str:
         """
@@ -294,16 +306,17 @@ class CubeQueryValidator:
             for invalid, suggestion in validation_result["suggestions"].items():
                 prompt_parts.append(f"  - Replace '{invalid}' with '{suggestion}'")
 
-        # Add available schema info
+        # Add available schema info (sorted names come from the cached summary)
+        summary = self.get_schema_summary()
         prompt_parts.append(f"\nAvailable measures in '{self.cube_name}':")
-        prompt_parts.append(f"  {', '.join(sorted(self.available_measures))}")
+        prompt_parts.append(f"  {', '.join(summary['measures'])}")
 
         prompt_parts.append(f"\nAvailable dimensions in '{self.cube_name}':")
-        prompt_parts.append(f"  {', '.join(sorted(self.available_dimensions))}")
+        prompt_parts.append(f"  {', '.join(summary['dimensions'])}")
 
         if self.available_time_dimensions:
             prompt_parts.append(f"\nAvailable time dimensions in '{self.cube_name}':")
-            prompt_parts.append(f"  {', '.join(sorted(self.available_time_dimensions))}")
+            prompt_parts.append(f"  {', '.join(summary['time_dimensions'])}")
 
         prompt_parts.append(f"\nPlease regenerate the cube query for the user's question: \"{original_query}\"")
         prompt_parts.append("Use ONLY the measures and dimensions listed above.")
@@ -61,16 +61,19 @@ class LLMClient:
             messages = conversation_messages.copy()
             messages.append({"role": "user", "content": user_query})
 
-            print(f"🔍 DEBUG: Sending request to OpenAI API")
-            print(f"   Model: {self.model}")
-            print(f"   Temperature: 0.1")
-            print(f"   Max tokens: 2000")
-            print(f"   Messages count: {len(messages)}")
-            print(f"   User query: {user_query}")
-            print(f"   System prompt length: {len(messages[0]['content']) if messages and messages[0]['role'] == 'system' else 'No system message'}")
+            # Debug blocks are joined so each is a single write to stdout
+            print("\n".join((
+                "🔍 DEBUG: Sending request to OpenAI API",
+                f"   Model: {self.model}",
+                "   Temperature: 0.1",
+                "   Max tokens: 2000",
+                f"   Messages count: {len(messages)}",
+                f"   User query: {user_query}",
+                f"   System prompt length: {len(messages[0]['content']) if messages and messages[0]['role'] == 'system' else 'No system message'}",
+                "🔍 DEBUG: Calling OpenAI API with JSON mode (json_object)..."
+            )))
 
             # Call OpenAI API with JSON mode for guaranteed JSON format
-            print("🔍 DEBUG: Calling OpenAI API with JSON mode (json_object)...")
             response = self.client.chat.completions.create(
                 model=self.model,
                 messages=messages,
@@ -83,12 +86,16 @@ class LLMClient:
             # Extract and parse response
             response_content = response.choices[0].message.content
 
-            print(f"🔍 DEBUG: Received OpenAI response")
-            print(f"   Response length: {len(response_content)}")
-            print(f"   Usage: {response.usage.total_tokens} tokens total ({response.usage.prompt_tokens} prompt + {response.usage.completion_tokens} completion)")
-            print(f"   Raw response content: {response_content[:500]}{'...' if len(response_content) > 500 else ''}")
+            cached_tokens = self._get_cached_prompt_tokens(response.usage)
+            print("\n".join((
+                "🔍 DEBUG: Received OpenAI response",
+                f"   Response length: {len(response_content)}",
+                f"   Usage: {response.usage.total_tokens} tokens total ({response.usage.prompt_tokens} prompt + {response.usage.completion_tokens} completion)",
+                f"   Cached prompt tokens: {cached_tokens}",
+                f"   Raw response content: {response_content[:500]}{'...' if len(response_content) > 500 else ''}",
+                "🔍 DEBUG: Attempting to parse JSON response..."
+            )))
 
-            print("🔍 DEBUG: Attempting to parse JSON response...")
             parsed_response = json.loads(response_content)
             print(f"✅ DEBUG: JSON parsing successful. Response type: {parsed_response.get('response_type', 'unknown')}")
 
@@ -101,7 +108,8 @@ class LLMClient:
                 "usage": {
                     "prompt_tokens": response.usage.prompt_tokens,
                     "completion_tokens": response.usage.completion_tokens,
-                    "total_tokens": response.usage.total_tokens
+                    "total_tokens": response.usage.total_tokens,
+                    "cached_tokens": cached_tokens
                 },
                 "model": self.model,
                 "timestamp": datetime.now().isoformat()
@@ -116,6 +124,23 @@ class LLMClient:
             print(f"   Error type: {type(e).__name__}")
             return self._create_error_response(f"LLM API error: {str(e)}", user_query)
 
+    @staticmethod
+    def _get_cached_prompt_tokens(usage: Any) -> int:
+        """
+        Get how many prompt tokens were served from OpenAI's prompt cache.
+
+        OpenAI caches repeated prompt prefixes of 1024+ tokens automatically, which is
+        why the static system prompt is kept ahead of the per-query context.
+
+        Args:
+            usage: Usage object from a chat completion response
+
+        Returns:
+            Number of cached prompt tokens, 0 if not reported
+        """
+        details = getattr(usage, "prompt_tokens_details", None)
+        return getattr(details, "cached_tokens", None) or 0
+
     def _normalize_response(self, llm_response: Dict[str, Any], user_query: str) -> Dict[str, Any]:
         """
         Normalize LLM response to expected format.
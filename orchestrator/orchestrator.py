@@ -3,11 +3,15 @@
 
 import sys
 import os
-import json
-from typing import Dict, List, Any, Optional
+import logging
+import time
+from concurrent.futures import ThreadPoolExecutor
+from typing import Dict, List, Any, Optional, Literal
 from datetime import datetime
 from pathlib import Path
 
+import orjson
+
 # Load environment variables from .env file
 try:
     from dotenv import load_dotenv
@@ -28,15 +32,36 @@ from conversation_manager import ConversationManager, ConversationManagerError
 from llm_client import LLMClient, LLMClientError
 from cube_client import CubeClient, CubeClientError
 from cube_query_validator import CubeQueryValidator, CubeQueryValidatorError
-from cube_metadata_fetcher import CubeMetadataFetcher, CubeMetadataFetcherError
+from cube_metadata_fetcher import CubeMetadataFetcher, CubeMetadataFetcherError, content_fingerprint
 
-# Import system prompt generator
-try:
-    from system_prompt_generator.context_preparation.context_manager import ContextManager
-except ImportError:
-    # Fallback import path
-    sys.path.append(os.path.join(os.path.dirname(__file__), 'system-prompt-generator', 'context_preparation'))
-    from context_manager import ContextManager
+# Import system prompt generator (context_preparation package under system-prompt-generator)
+from context_preparation.context_manager import ContextManager
+
+
+logger = logging.getLogger(__name__)
+
+# (second, formatted prefix) of the last timestamp, reformatted at most once per
+# second; kept as one tuple so threads never see a prefix from another second
+_last_timestamp = (None, "")
+
+
+def _current_timestamp() -> str:
+    """
+    Get the current local time as an ISO 8601 string with millisecond precision.
+
+    Returns:
+        Timestamp string such as 2024-08-01T12:30:45.123
+    """
+    global _last_timestamp
+
+    now = time.time()
+    second = int(now)
+    cached_second, prefix = _last_timestamp
+    if second != cached_second:
+        prefix = time.strftime("%Y-%m-%dT%H:%M:%S", time.localtime(second))
+        _last_timestamp = (second, prefix)
+
+    return f"{prefix}.{int((now - second) * 1000):03d}"
 
 
 class QueryOrchestrator:
@@ -97,6 +122,16 @@ class QueryOrchestrator:
             'event_performance_overview.yml'
         )
         self.query_validator = None
+        self._validator_fingerprint = None
+
+        # Signature of the Cube metadata, views, config and templates the current
+        # system prompt was generated from; stored with the prompt cache
+        self._prompt_signature = None
+
+        # Short-lived cache of the cube list served by get_available_cubes
+        self.available_cubes_ttl = 60.0
+        self._available_cubes: Optional[List[str]] = None
+        self._available_cubes_fetched_at: Optional[float] = None
 
         # Orchestrator state
         self.is_initialized = False
@@ -118,8 +153,9 @@ class QueryOrchestrator:
 
                 # Load metadata if available
                 if os.path.exists(self.system_prompt_metadata_file):
-                    with open(self.system_prompt_metadata_file, 'r', encoding='utf-8') as f:
-                        self.system_prompt_metadata = json.load(f)
+                    with open(self.system_prompt_metadata_file, 'rb') as f:
+                        self.system_prompt_metadata = orjson.loads(f.read())
+                    self._prompt_signature = self.system_prompt_metadata.get("prompt_signature")
                 else:
                     self.system_prompt_metadata = {
                         "loaded_from_cache": True,
@@ -164,15 +200,19 @@ class QueryOrchestrator:
             with open(self.system_prompt_cache_file, 'w', encoding='utf-8') as f:
                 f.write(system_prompt)
 
-            # Save metadata
+            # Save metadata, including what the prompt was generated from
+            self._prompt_signature = self.context_manager.get_prompt_signature()
             cache_metadata = {
                 **metadata,
+                "prompt_signature": self._prompt_signature,
                 "cached_at": datetime.now().isoformat(),
                 "cache_file": self.system_prompt_cache_file
             }
 
-            with open(self.system_prompt_metadata_file, 'w', encoding='utf-8') as f:
-                json.dump(cache_metadata, f, indent=2)
+            # Compact JSON: the file is shared with update-system-prompt.sh and
+            # /system-prompt-info, so it stays JSON but skips pretty-printing
+            with open(self.system_prompt_metadata_file, 'wb') as f:
+                f.write(orjson.dumps(cache_metadata))
 
             self.system_prompt_metadata = cache_metadata
             return True
@@ -221,15 +261,22 @@ class QueryOrchestrator:
         }
 
         try:
-            # Initialize CUBE client
-            cube_init = self.cube_client.initialize()
+            # The OpenAI key check is an independent network round trip, so run it
+            # while the CUBE client authenticates and loads its metadata
+            with ThreadPoolExecutor(max_workers=1) as executor:
+                llm_future = executor.submit(self.llm_client.validate_api_key)
+
+                # Initialize CUBE client
+                cube_init = self.cube_client.initialize()
+
+                llm_valid = llm_future.result()
+
             initialization_result["components"]["cube_client"] = cube_init
 
             if not cube_init["success"]:
                 initialization_result["errors"].append(f"CUBE initialization failed: {cube_init['error']}")
 
             # Validate LLM client
-            llm_valid = self.llm_client.validate_api_key()
             initialization_result["components"]["llm_client"] = {
                 "success": llm_valid,
                 "model": self.llm_client.model
@@ -244,7 +291,8 @@ class QueryOrchestrator:
                     self.metadata_fetcher = CubeMetadataFetcher(
                         base_url=self.cube_base_url,
                         jwt_token=self.cube_client.jwt_token,
-                        cache_dir=self.cache_dir
+                        cache_dir=self.cache_dir,
+                        session=self.cube_client.session
                     )
 
                     # Fetch metadata from Cube API
@@ -328,42 +376,8 @@ class QueryOrchestrator:
                     view_metadata = self.metadata_fetcher.get_view_metadata('EventPerformanceOverview')
 
                     if view_metadata.get('success'):
-                        # Convert to validator-compatible format
-                        # Strip cube prefix from field names (EventPerformanceOverview.revenues -> revenues)
-                        measures_without_prefix = []
-                        for measure in view_metadata['measures']:
-                            field_name = measure['name']
-                            # Remove prefix if present
-                            if '.' in field_name:
-                                field_name = field_name.split('.', 1)[1]
-                            measures_without_prefix.append({
-                                'name': field_name,
-                                'title': measure.get('title', ''),
-                                'description': measure.get('description', '')
-                            })
-
-                        dimensions_without_prefix = []
-                        for dimension in view_metadata['dimensions']:
-                            field_name = dimension['name']
-                            # Remove prefix if present
-                            if '.' in field_name:
-                                field_name = field_name.split('.', 1)[1]
-                            dimensions_without_prefix.append({
-                                'name': field_name,
-                                'title': dimension.get('title', ''),
-                                'description': dimension.get('description', ''),
-                                'type': dimension.get('type', '')  # Include type for time dimension validation
-                            })
-
-                        validator_metadata = {
-                            'name': view_metadata['view'],
-                            'title': view_metadata.get('title', ''),
-                            'description': view_metadata.get('description', ''),
-                            'measures': measures_without_prefix,
-                            'dimensions': dimensions_without_prefix
-                        }
-
-                        self.query_validator = CubeQueryValidator(metadata_dict=validator_metadata)
+                        # Prefix-stripped, validator-compatible fields are built by the fetcher
+                        self._set_validator_from_metadata(view_metadata['validator_metadata'])
                         schema_summary = self.query_validator.get_schema_summary()
                         print(f"✅ Query validator initialized with dynamic metadata")
                         print(f"   Cube: {schema_summary['cube_name']}")
@@ -379,6 +393,7 @@ class QueryOrchestrator:
                         print(f"⚠️  Failed to get view metadata: {view_metadata.get('error')}")
                         print(f"🔍 DEBUG: Falling back to YAML validator")
                         self.query_validator = CubeQueryValidator(view_yml_path=self.view_yml_path)
+                        self._validator_fingerprint = None
                         schema_summary = self.query_validator.get_schema_summary()
                         print(f"✅ Query validator initialized from YAML (fallback)")
                         initialization_result["components"]["query_validator"] = {
@@ -391,6 +406,7 @@ class QueryOrchestrator:
                     # Use static YAML validator
                     print(f"🔍 DEBUG: Initializing query validator with YAML: {self.view_yml_path}")
                     self.query_validator = CubeQueryValidator(view_yml_path=self.view_yml_path)
+                    self._validator_fingerprint = None
                     schema_summary = self.query_validator.get_schema_summary()
                     print(f"✅ Query validator initialized successfully from YAML")
                     print(f"   Cube: {schema_summary['cube_name']}")
@@ -430,6 +446,25 @@ class QueryOrchestrator:
             initialization_result["errors"].append(f"Unexpected initialization error: {str(e)}")
             return initialization_result
 
+    def _set_validator_from_metadata(self, validator_metadata: Dict[str, Any]) -> bool:
+        """
+        Build the query validator from metadata unless it is unchanged since the last build.
+
+        Args:
+            validator_metadata: Validator-compatible metadata dictionary
+
+        Returns:
+            True if a new validator was built, False if the existing one was kept
+        """
+        fingerprint = content_fingerprint(validator_metadata)
+
+        if self.query_validator is not None and fingerprint == self._validator_fingerprint:
+            return False
+
+        self.query_validator = CubeQueryValidator(metadata_dict=validator_metadata)
+        self._validator_fingerprint = fingerprint
+        return True
+
     def process_query(self, user_query: str) -> Dict[str, Any]:
         """
         Process a natural language query through the complete pipeline.
@@ -492,9 +527,9 @@ class QueryOrchestrator:
                 # Validate and execute CUBE query with retry logic
                 cube_query = llm_response.get("cube_query")
 
-                print(f"🔍 DEBUG: Starting cube query validation and execution")
-                print(f"   Query validator available: {self.query_validator is not None}")
-                print(f"   Cube query: {json.dumps(cube_query, indent=2)}")
+                print(f"🔍 DEBUG: Starting cube query validation and execution\n"
+                      f"   Query validator available: {self.query_validator is not None}\n"
+                      f"   Cube query: {orjson.dumps(cube_query, option=orjson.OPT_INDENT_2 | orjson.OPT_NON_STR_KEYS).decode()}")
 
                 # Try to validate and execute query with retries
                 validation_attempts = 0
@@ -639,28 +674,36 @@ class QueryOrchestrator:
         """Clear conversation history."""
         self.conversation_manager.clear_conversation()
 
-    def get_status(self) -> Dict[str, Any]:
+    def get_status(self, depth: Literal["shallow", "full"] = "shallow") -> Dict[str, Any]:
         """
         Get orchestrator status and component health.
 
+        Args:
+            depth: "shallow" reports only local state; "full" also includes
+                conversation context and CUBE connectivity
+
         Returns:
             Status information for all components
         """
-        return {
+        status = {
             "orchestrator": {
                 "initialized": self.is_initialized,
                 "initialization_errors": self.initialization_errors,
                 "has_system_prompt": self.system_prompt is not None
             },
-            "conversation": self.conversation_manager.get_conversation_context(),
-            "cube_client": self.cube_client.get_connection_status(),
             "llm_client": {
                 "model": self.llm_client.model,
                 "api_key_configured": bool(self.llm_client.api_key)
             },
-            "timestamp": datetime.now().isoformat()
+            "timestamp": _current_timestamp()
         }
 
+        if depth == "full":
+            status["conversation"] = self.conversation_manager.get_conversation_context()
+            status["cube_client"] = self.cube_client.get_connection_status(force=False)
+
+        return status
+
     def regenerate_system_prompt(self) -> Dict[str, Any]:
         """
         Regenerate system prompt (useful when YML files are updated).
@@ -679,7 +722,7 @@ class QueryOrchestrator:
                 "success": True,
                 "new_prompt_length": len(self.system_prompt),
                 "metadata": prompt_result["metadata"],
-                "timestamp": datetime.now().isoformat()
+                "timestamp": _current_timestamp()
             }
         except Exception as e:
             return {
@@ -705,7 +748,8 @@ class QueryOrchestrator:
         try:
             # Clear metadata cache
             self.metadata_fetcher.clear_cache()
-            print("🔄 Cleared metadata cache")
+            self._available_cubes = None
+            logger.info("🔄 Cleared metadata cache")
 
             # Fetch fresh metadata from Cube API
             metadata_result = self.metadata_fetcher.fetch_metadata(use_cache=False)
@@ -717,10 +761,29 @@ class QueryOrchestrator:
                     "details": metadata_result.get("error")
                 }
 
-            print(f"✅ Fetched fresh metadata from Cube API")
+            logger.info("✅ Fetched fresh metadata from Cube API")
+
+            # Summary and per-view metadata are derived during the fetch itself
+            summary = metadata_result["summary"]
+            views_by_name = metadata_result["views_by_name"]
+
+            # Skip prompt and validator rebuild when neither the Cube metadata nor the
+            # views, config and template files changed since the prompt was generated
+            prompt_signature = self.context_manager.get_prompt_signature()
+            if prompt_signature == self._prompt_signature and self.system_prompt is not None:
+                logger.info("✅ Cube metadata and prompt sources unchanged, keeping current system prompt")
+                return {
+                    "success": True,
+                    "unchanged": True,
+                    "metadata_summary": summary,
+                    "system_prompt_metadata": self.system_prompt_metadata,
+                    "system_prompt_length": len(self.system_prompt),
+                    "timestamp": _current_timestamp()
+                }
 
-            # Get metadata summary
-            summary = self.metadata_fetcher.get_summary()
+            # Drop cached business configuration and templates so edits are picked up
+            self.context_manager.business_config.invalidate_cache()
+            self.context_manager.prompt_builder.refresh_templates()
 
             # Regenerate system prompt with new metadata
             prompt_result = self.context_manager.generate_system_prompt()
@@ -729,56 +792,28 @@ class QueryOrchestrator:
             # Save to cache
             self._save_system_prompt_cache(self.system_prompt, prompt_result["metadata"])
 
-            print(f"✅ Regenerated system prompt with {prompt_result['metadata']['views_count']} views")
+            logger.info("✅ Regenerated system prompt with %s views", prompt_result['metadata']['views_count'])
 
             # Refresh query validator with new metadata
             try:
-                view_metadata = self.metadata_fetcher.get_view_metadata('EventPerformanceOverview')
-                if view_metadata.get('success'):
-                    # Strip cube prefix from field names
-                    measures_without_prefix = []
-                    for measure in view_metadata['measures']:
-                        field_name = measure['name']
-                        if '.' in field_name:
-                            field_name = field_name.split('.', 1)[1]
-                        measures_without_prefix.append({
-                            'name': field_name,
-                            'title': measure.get('title', ''),
-                            'description': measure.get('description', '')
-                        })
-
-                    dimensions_without_prefix = []
-                    for dimension in view_metadata['dimensions']:
-                        field_name = dimension['name']
-                        if '.' in field_name:
-                            field_name = field_name.split('.', 1)[1]
-                        dimensions_without_prefix.append({
-                            'name': field_name,
-                            'title': dimension.get('title', ''),
-                            'description': dimension.get('description', ''),
-                            'type': dimension.get('type', '')  # Include type for time dimension validation
-                        })
-
-                    validator_metadata = {
-                        'name': view_metadata['view'],
-                        'title': view_metadata.get('title', ''),
-                        'description': view_metadata.get('description', ''),
-                        'measures': measures_without_prefix,
-                        'dimensions': dimensions_without_prefix
-                    }
-                    self.query_validator = CubeQueryValidator(metadata_dict=validator_metadata)
-                    print(f"✅ Query validator refreshed with new metadata")
+                view_metadata = views_by_name.get('EventPerformanceOverview')
+                if view_metadata:
+                    if self._set_validator_from_metadata(view_metadata['validator_metadata']):
+                        logger.info("✅ Query validator refreshed with new metadata")
+                    else:
+                        logger.info("✅ Query validator unchanged, keeping existing instance")
                 else:
-                    print(f"⚠️  Failed to refresh validator: {view_metadata.get('error')}")
+                    logger.warning("⚠️  Failed to refresh validator: View/cube '%s' not found in metadata", 'EventPerformanceOverview')
             except Exception as e:
-                print(f"⚠️  Warning: Failed to refresh query validator: {str(e)}")
+                logger.warning("⚠️  Warning: Failed to refresh query validator: %s", e)
 
             return {
                 "success": True,
+                "unchanged": False,
                 "metadata_summary": summary,
                 "system_prompt_metadata": prompt_result["metadata"],
                 "system_prompt_length": len(self.system_prompt),
-                "timestamp": datetime.now().isoformat()
+                "timestamp": _current_timestamp()
             }
 
         except Exception as e:
@@ -792,10 +827,23 @@ class QueryOrchestrator:
         """
         Get list of available CUBE cubes.
 
+        The list is reused for available_cubes_ttl seconds and dropped on
+        metadata refresh.
+
         Returns:
             List of cube names
         """
-        return self.cube_client.get_available_cubes()
+        now = time.monotonic()
+        if (self._available_cubes is None or
+                now - self._available_cubes_fetched_at > self.available_cubes_ttl):
+            cubes = self.cube_client.get_available_cubes()
+            if not cubes:
+                # Empty list means the Cube API call failed; don't cache it
+                return cubes
+            self._available_cubes = cubes
+            self._available_cubes_fetched_at = now
+
+        return list(self._available_cubes)
 
     def validate_cube_query(self, cube_query: Dict[str, Any]) -> Dict[str, Any]:
         """
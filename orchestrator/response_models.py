@@ -46,112 +46,114 @@ class ErrorResponse(BaseModel):
     confidence_score: float = Field(ge=0.0, le=1.0, default=0.0, description="Confidence score between 0 and 1")
 
 
-# Union type for all possible responses
-class QueryResponse(BaseModel):
-    """Union response model that can be any of the three response types"""
-    pass  # This will be used as discriminator in the API call
+# JSON schema for OpenAI Structured Outputs, built once at import time.
+# Note: OpenAI Structured Outputs doesn't support if/then/else,
+# so we make all fields optional and validate in the code.
+# This is deliberately not generated from the pydantic models: strict mode
+# rejects the oneOf, ge/le bounds and defaults their JSON schema contains.
+_RESPONSE_SCHEMA: Dict[str, Any] = {
+    "name": "query_response",
+    "strict": True,
+    "schema": {
+        "type": "object",
+        "properties": {
+            "response_type": {
+                "type": "string",
+                "enum": ["cube_query", "clarification_needed", "error"],
+                "description": "The type of response being returned"
+            },
+            "cube_query": {
+                "type": ["object", "null"],
+                "properties": {
+                    "measures": {
+                        "type": ["array", "null"],
+                        "items": {"type": "string"},
+                        "description": "List of measures to query"
+                    },
+                    "dimensions": {
+                        "type": ["array", "null"],
+                        "items": {"type": "string"},
+                        "description": "List of dimensions to query"
+                    },
+                    "timeDimensions": {
+                        "type": ["array", "null"],
+                        "items": {
+                            "type": "object",
+                            "properties": {
+                                "dimension": {"type": "string"},
+                                "granularity": {
+                                    "type": ["string", "null"]
+                                },
+                                "dateRange": {
+                                    "type": ["array", "null"],
+                                    "items": {"type": "string"}
+                                }
+                            },
+                            "required": ["dimension"],
+                            "additionalProperties": False
+                        },
+                        "description": "Time-based dimensions"
+                    },
+                    "filters": {
+                        "type": ["array", "null"],
+                        "items": {
+                            "type": "object",
+                            "additionalProperties": True
+                        },
+                        "description": "Query filters"
+                    },
+                    "limit": {
+                        "type": ["integer", "null"],
+                        "description": "Result limit"
+                    },
+                    "order": {
+                        "type": ["object", "null"],
+                        "additionalProperties": True,
+                        "description": "Sort order"
+                    }
+                },
+                "required": [],
+                "additionalProperties": False,
+                "description": "CUBE query object (required when response_type is cube_query)"
+            },
+            "description": {
+                "type": ["string", "null"],
+                "description": "Human-readable description (required for cube_query and error types)"
+            },
+            "message": {
+                "type": ["string", "null"],
+                "description": "Message for clarification (required when response_type is clarification_needed)"
+            },
+            "questions": {
+                "type": ["array", "null"],
+                "items": {"type": "string"},
+                "description": "Questions for clarification (required when response_type is clarification_needed)"
+            },
+            "suggestions": {
+                "type": ["array", "null"],
+                "items": {"type": "string"},
+                "description": "Example queries for clarification (required when response_type is clarification_needed)"
+            },
+            "confidence_score": {
+                "type": "number",
+                "description": "Confidence score between 0 and 1"
+            }
+        },
+        "required": ["response_type", "confidence_score"],
+        "additionalProperties": False
+    }
+}
 
 
 # Function to get the JSON schema for OpenAI API
 def get_response_schema() -> Dict[str, Any]:
     """
-    Generate JSON schema for OpenAI Structured Outputs.
+    Get the JSON schema for OpenAI Structured Outputs.
 
-    Note: OpenAI Structured Outputs doesn't support if/then/else,
-    so we make all fields optional and validate in the code.
+    The schema is static, so the same shared dictionary is returned on every
+    call. Callers must treat it as read-only.
 
     Returns:
         JSON schema dictionary compatible with OpenAI API
     """
-    return {
-        "name": "query_response",
-        "strict": True,
-        "schema": {
-            "type": "object",
-            "properties": {
-                "response_type": {
-                    "type": "string",
-                    "enum": ["cube_query", "clarification_needed", "error"],
-                    "description": "The type of response being returned"
-                },
-                "cube_query": {
-                    "type": ["object", "null"],
-                    "properties": {
-                        "measures": {
-                            "type": ["array", "null"],
-                            "items": {"type": "string"},
-                            "description": "List of measures to query"
-                        },
-                        "dimensions": {
-                            "type": ["array", "null"],
-                            "items": {"type": "string"},
-                            "description": "List of dimensions to query"
-                        },
-                        "timeDimensions": {
-                            "type": ["array", "null"],
-                            "items": {
-                                "type": "object",
-                                "properties": {
-                                    "dimension": {"type": "string"},
-                                    "granularity": {
-                                        "type": ["string", "null"]
-                                    },
-                                    "dateRange": {
-                                        "type": ["array", "null"],
-                                        "items": {"type": "string"}
-                                    }
-                                },
-                                "required": ["dimension"],
-                                "additionalProperties": False
-                            },
-                            "description": "Time-based dimensions"
-                        },
-                        "filters": {
-                            "type": ["array", "null"],
-                            "items": {
-                                "type": "object",
-                                "additionalProperties": True
-                            },
-                            "description": "Query filters"
-                        },
-                        "limit": {
-                            "type": ["integer", "null"],
-                            "description": "Result limit"
-                        },
-                        "order": {
-                            "type": ["object", "null"],
-                            "additionalProperties": True,
-                            "description": "Sort order"
-                        }
-                    },
-                    "required": [],
-                    "additionalProperties": False,
-                    "description": "CUBE query object (required when response_type is cube_query)"
-                },
-                "description": {
-                    "type": ["string", "null"],
-                    "description": "Human-readable description (required for cube_query and error types)"
-                },
-                "message": {
-                    "type": ["string", "null"],
-                    "description": "Message for clarification (required when response_type is clarification_needed)"
-                },
-                "questions": {
-                    "type": ["array", "null"],
-                    "items": {"type": "string"},
-                    "description": "Questions for clarification (required when response_type is clarification_needed)"
-                },
-                "suggestions": {
-                    "type": ["array", "null"],
-                    "items": {"type": "string"},
-                    "description": "Example queries for clarification (required when response_type is clarification_needed)"
-                },
-                "confidence_score": {
-                    "type": "number",
-                    "description": "Confidence score between 0 and 1"
-                }
-            },
-            "required": ["response_type", "confidence_score"],
-            "additionalProperties": False
-        }
-    }
+    return _RESPONSE_SCHEMA
@@ -45,16 +45,14 @@ import os
 import json
 from datetime import datetime
 
-# Add the context_preparation directory to Python path
-sys.path.insert(0, '/app/system-prompt-generator/context_preparation')
-sys.path.insert(0, '/app/system-prompt-generator/utils')
+# Add the system-prompt-generator directory to Python path
 sys.path.insert(0, '/app/system-prompt-generator')
 
 print('Python paths added for system prompt generation')
 
 try:
-    # Import context manager directly from the file
-    from context_manager import ContextManager
+    # Import context manager from the context_preparation package
+    from context_preparation.context_manager import ContextManager
 
     print('ContextManager imported successfully')
     context_manager = ContextManager('/app/system-prompt-generator')
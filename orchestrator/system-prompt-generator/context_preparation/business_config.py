@@ -1,13 +1,124 @@
 # ABOUTME: Manager for business domain configuration and entity definitions
 # ABOUTME: Loads and validates business context for semantic layer integration
 
-from typing import Dict, List, Any, Optional
+from typing import Dict, List, Any, Optional, Tuple
 from pathlib import Path
-
-import sys
-import os
-sys.path.append(os.path.join(os.path.dirname(__file__), '..', 'utils'))
-from file_loader import FileLoader
+from concurrent.futures import ThreadPoolExecutor
+
+import copy
+import logging
+
+from utils.file_loader import FileLoader
+
+logger = logging.getLogger(__name__)
+
+
+# Fallback configuration used when a YAML file is missing or unreadable.
+# Defined once at module level; callers receive a deep copy they may modify.
+_DEFAULT_BUSINESS_DOMAIN = {
+    "business_name": "Event Management System",
+    "business_description": "A comprehensive event management platform that tracks events, ticket sales, orders, and customer interactions.",
+    "domain": "event_management",
+    "entities": [
+        {
+            "name": "Events",
+            "description": "Core entity representing events with details like name, dates, venue, and pricing",
+            "key_attributes": ["name", "start_date", "end_date", "venue", "status"],
+            "relationships": ["has_many_orders", "has_many_tickets"]
+        },
+        {
+            "name": "Orders",
+            "description": "Purchase transactions containing order details, amounts, and customer information",
+            "key_attributes": ["order_value", "quantity", "order_date", "status"],
+            "relationships": ["belongs_to_event", "belongs_to_customer"]
+        },
+        {
+            "name": "Customers",
+            "description": "Individuals or organizations purchasing tickets and attending events",
+            "key_attributes": ["name", "email", "registration_date", "total_purchases"],
+            "relationships": ["has_many_orders"]
+        },
+        {
+            "name": "Tickets",
+            "description": "Individual tickets sold for events with pricing and category information",
+            "key_attributes": ["ticket_type", "price", "quantity_sold", "availability"],
+            "relationships": ["belongs_to_event"]
+        }
+    ],
+    "key_metrics": [
+        {
+            "name": "Total Revenue",
+            "description": "Sum of all order values for events",
+            "calculation": "SUM(order_value)"
+        },
+        {
+            "name": "Tickets Sold",
+            "description": "Total number of tickets sold across all events",
+            "calculation": "SUM(quantity)"
+        },
+        {
+            "name": "Event Performance",
+            "description": "Revenue and attendance metrics grouped by event",
+            "calculation": "Revenue and ticket sales per event"
+        }
+    ],
+    "common_questions": [
+        "Which events are performing best in terms of revenue?",
+        "How many tickets have been sold for each event?",
+        "What is the total revenue for a specific time period?",
+        "Which customers are the highest spenders?",
+        "What are the monthly sales trends?"
+    ]
+}
+
+_DEFAULT_PROMPT_SETTINGS = {
+    "max_prompt_length": 4000,
+    "include_examples": True,
+    "include_business_context": True,
+    "include_view_specifications": True,
+    "include_api_instructions": True,
+    "ambiguity_handling": True,
+    "response_format": "structured_json",
+    "confidence_threshold": 0.7,
+    "max_clarification_questions": 3,
+    "include_metadata": True
+}
+
+_DEFAULT_AMBIGUITY_CONFIG = {
+    "ambiguity_triggers": [
+        {
+            "type": "missing_time_range",
+            "keywords": ["show", "get", "find"],
+            "missing_elements": ["time", "date", "period", "when"],
+            "clarification": "What time period are you interested in?"
+        },
+        {
+            "type": "unclear_grouping",
+            "keywords": ["by", "group", "break down"],
+            "missing_elements": ["dimension", "category"],
+            "clarification": "How would you like the data grouped or categorized?"
+        },
+        {
+            "type": "ambiguous_metrics",
+            "keywords": ["performance", "numbers", "data", "metrics"],
+            "missing_elements": ["specific_measure"],
+            "clarification": "Which specific metrics are you looking for?"
+        }
+    ],
+    "confidence_scoring": {
+        "has_specific_measure": 0.3,
+        "has_time_context": 0.2,
+        "has_grouping_context": 0.2,
+        "matches_known_patterns": 0.3
+    },
+    "minimum_confidence": 0.6,
+    "clarification_templates": {
+        "general": "I need more information to provide accurate results. Could you specify:",
+        "time_missing": "What time period should I analyze?",
+        "metric_missing": "Which metrics are you interested in?",
+        "grouping_missing": "How would you like the results organized?"
+    }
+}
 
 
 class BusinessConfig:
@@ -31,6 +142,10 @@ class BusinessConfig:
         self.prompt_settings_file = "prompt_settings.yaml"
         self.ambiguity_config_file = "ambiguity_config.yaml"
 
+        # Last validation result, keyed by the mtimes of the config directory and files
+        self._validation_key: Optional[Tuple[float, ...]] = None
+        self._validation_issues: List[str] = []
+
     def load_business_context(self) -> Dict[str, Any]:
         """
         Load complete business context configuration.
@@ -38,10 +153,16 @@ class BusinessConfig:
         Returns:
             Dictionary containing business domain information
         """
+        # The three files are independent, so read and parse them concurrently
+        with ThreadPoolExecutor(max_workers=3) as executor:
+            domain_future = executor.submit(self._load_business_domain)
+            settings_future = executor.submit(self._load_prompt_settings)
+            ambiguity_future = executor.submit(self._load_ambiguity_config)
+
         business_context = {
-            'domain_info': self._load_business_domain(),
-            'prompt_settings': self._load_prompt_settings(),
-            'ambiguity_rules': self._load_ambiguity_config(),
+            'domain_info': domain_future.result(),
+            'prompt_settings': settings_future.result(),
+            'ambiguity_rules': ambiguity_future.result(),
             'metadata': {
                 'config_loaded': True,
                 'config_path': str(self.config_path)
@@ -63,11 +184,10 @@ class BusinessConfig:
             if not file_path.exists():
                 return self._get_default_business_domain()
 
-            content = self.file_loader.load_yaml_file(str(file_path))
-            return content
+            return self.file_loader.load_yaml_file(str(file_path))
 
         except Exception as e:
-            print(f"Warning: Failed to load business domain config: {str(e)}")
+            logger.warning("Failed to load business domain config: %s", e)
             return self._get_default_business_domain()
 
     def _load_prompt_settings(self) -> Dict[str, Any]:
@@ -83,11 +203,10 @@ class BusinessConfig:
             if not file_path.exists():
                 return self._get_default_prompt_settings()
 
-            content = self.file_loader.load_yaml_file(str(file_path))
-            return content
+            return self.file_loader.load_yaml_file(str(file_path))
 
         except Exception as e:
-            print(f"Warning: Failed to load prompt settings: {str(e)}")
+            logger.warning("Failed to load prompt settings: %s", e)
             return self._get_default_prompt_settings()
 
     def _load_ambiguity_config(self) -> Dict[str, Any]:
@@ -103,13 +222,16 @@ class BusinessConfig:
             if not file_path.exists():
                 return self._get_default_ambiguity_config()
 
-            content = self.file_loader.load_yaml_file(str(file_path))
-            return content
+            return self.file_loader.load_yaml_file(str(file_path))
 
         except Exception as e:
-            print(f"Warning: Failed to load ambiguity config: {str(e)}")
+            logger.warning("Failed to load ambiguity config: %s", e)
             return self._get_default_ambiguity_config()
 
+    def invalidate_cache(self) -> None:
+        """Clear cached configuration so the next access re-reads the YAML files."""
+        self.file_loader.clear_cache()
+
     def _get_default_business_domain(self) -> Dict[str, Any]:
         """
         Get default business domain configuration.
@@ -117,61 +239,7 @@ class BusinessConfig:
         Returns:
             Default business domain configuration
         """
-        return {
-            "business_name": "Event Management System",
-            "business_description": "A comprehensive event management platform that tracks events, ticket sales, orders, and customer interactions.",
-            "domain": "event_management",
-            "entities": [
-                {
-                    "name": "Events",
-                    "description": "Core entity representing events with details like name, dates, venue, and pricing",
-                    "key_attributes": ["name", "start_date", "end_date", "venue", "status"],
-                    "relationships": ["has_many_orders", "has_many_tickets"]
-                },
-                {
-                    "name": "Orders",
-                    "description": "Purchase transactions containing order details, amounts, and customer information",
-                    "key_attributes": ["order_value", "quantity", "order_date", "status"],
-                    "relationships": ["belongs_to_event", "belongs_to_customer"]
-                },
-                {
-                    "name": "Customers",
-                    "description": "Individuals or organizations purchasing tickets and attending events",
-                    "key_attributes": ["name", "email", "registration_date", "total_purchases"],
-                    "relationships": ["has_many_orders"]
-                },
-                {
-                    "name": "Tickets",
-                    "description": "Individual tickets sold for events with pricing and category information",
-                    "key_attributes": ["ticket_type", "price", "quantity_sold", "availability"],
-                    "relationships": ["belongs_to_event"]
-                }
-            ],
-            "key_metrics": [
-                {
-                    "name": "Total Revenue",
-                    "description": "Sum of all order values for events",
-                    "calculation": "SUM(order_value)"
-                },
-                {
-                    "name": "Tickets Sold",
-                    "description": "Total number of tickets sold across all events",
-                    "calculation": "SUM(quantity)"
-                },
-                {
-                    "name": "Event Performance",
-                    "description": "Revenue and attendance metrics grouped by event",
-                    "calculation": "Revenue and ticket sales per event"
-                }
-            ],
-            "common_questions": [
-                "Which events are performing best in terms of revenue?",
-                "How many tickets have been sold for each event?",
-                "What is the total revenue for a specific time period?",
-                "Which customers are the highest spenders?",
-                "What are the monthly sales trends?"
-            ]
-        }
+        return copy.deepcopy(_DEFAULT_BUSINESS_DOMAIN)
 
     def _get_default_prompt_settings(self) -> Dict[str, Any]:
         """
@@ -180,18 +248,7 @@ class BusinessConfig:
         Returns:
             Default prompt settings
         """
-        return {
-            "max_prompt_length": 4000,
-            "include_examples": True,
-            "include_business_context": True,
-            "include_view_specifications": True,
-            "include_api_instructions": True,
-            "ambiguity_handling": True,
-            "response_format": "structured_json",
-            "confidence_threshold": 0.7,
-            "max_clarification_questions": 3,
-            "include_metadata": True
-        }
+        return copy.deepcopy(_DEFAULT_PROMPT_SETTINGS)
 
     def _get_default_ambiguity_config(self) -> Dict[str, Any]:
         """
@@ -200,41 +257,7 @@ class BusinessConfig:
         Returns:
             Default ambiguity configuration
         """
-        return {
-            "ambiguity_triggers": [
-                {
-                    "type": "missing_time_range",
-                    "keywords": ["show", "get", "find"],
-                    "missing_elements": ["time", "date", "period", "when"],
-                    "clarification": "What time period are you interested in?"
-                },
-                {
-                    "type": "unclear_grouping",
-                    "keywords": ["by", "group", "break down"],
-                    "missing_elements": ["dimension", "category"],
-                    "clarification": "How would you like the data grouped or categorized?"
-                },
-                {
-                    "type": "ambiguous_metrics",
-                    "keywords": ["performance", "numbers", "data", "metrics"],
-                    "missing_elements": ["specific_measure"],
-                    "clarification": "Which specific metrics are you looking for?"
-                }
-            ],
-            "confidence_scoring": {
-                "has_specific_measure": 0.3,
-                "has_time_context": 0.2,
-                "has_grouping_context": 0.2,
-                "matches_known_patterns": 0.3
-            },
-            "minimum_confidence": 0.6,
-            "clarification_templates": {
-                "general": "I need more information to provide accurate results. Could you specify:",
-                "time_missing": "What time period should I analyze?",
-                "metric_missing": "Which metrics are you interested in?",
-                "grouping_missing": "How would you like the results organized?"
-            }
-        }
+        return copy.deepcopy(_DEFAULT_AMBIGUITY_CONFIG)
 
     def get_business_entities(self) -> List[Dict[str, Any]]:
         """
@@ -270,6 +293,45 @@ class BusinessConfig:
         """
         Validate business configuration and return any issues.
 
+        The result is reused until the configuration directory or one of the
+        configuration files changes on disk.
+
+        Returns:
+            List of validation issues
+        """
+        validation_key = self._get_config_mtimes()
+
+        if validation_key != self._validation_key:
+            self._validation_issues = self._run_validation()
+            self._validation_key = validation_key
+
+        return list(self._validation_issues)
+
+    def _get_config_mtimes(self) -> Tuple[float, ...]:
+        """
+        Get modification times of the config directory and configuration files.
+
+        Returns:
+            Tuple of mtimes, with 0.0 for any path that does not exist
+        """
+        paths = (
+            self.config_path,
+            self.config_path / self.business_domain_file,
+            self.config_path / self.prompt_settings_file,
+            self.config_path / self.ambiguity_config_file
+        )
+        mtimes = []
+        for path in paths:
+            try:
+                mtimes.append(path.stat().st_mtime)
+            except OSError:
+                mtimes.append(0.0)
+        return tuple(mtimes)
+
+    def _run_validation(self) -> List[str]:
+        """
+        Run the configuration checks.
+
         Returns:
             List of validation issues
         """
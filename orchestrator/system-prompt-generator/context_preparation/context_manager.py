@@ -2,23 +2,20 @@
 # ABOUTME: Coordinates YML parsing, business config, and prompt building for OpenAI API calls
 # ABOUTME: Supports both dynamic Cube metadata fetching and static YAML fallback
 
-from typing import Dict, List, Optional, Any
+from typing import Dict, List, Optional, Any, Tuple
 import os
+import hashlib
+import logging
+from datetime import datetime
 from pathlib import Path
 
-import sys
-import os
-
-# Add paths for imports
-current_dir = os.path.dirname(__file__)
-sys.path.append(current_dir)
-sys.path.append(os.path.join(current_dir, '..', 'utils'))
+from utils.file_loader import FileLoader
+from .yml_parser import YMLParser, list_view_files
+from .prompt_builder import PromptBuilder
+from .business_config import BusinessConfig
+from .example_manager import ExampleManager
 
-from yml_parser import YMLParser
-from prompt_builder import PromptBuilder
-from business_config import BusinessConfig
-from example_manager import ExampleManager
-from file_loader import FileLoader
+logger = logging.getLogger(__name__)
 
 
 class ContextManager:
@@ -57,50 +54,177 @@ class ContextManager:
         self.cube_metadata_fetcher = cube_metadata_fetcher
         self.use_dynamic_metadata = cube_metadata_fetcher is not None
 
+        # View file listing, reused while the views directory mtime is unchanged
+        self._view_files_mtime: Optional[int] = None
+        self._view_files: List[Path] = []
+
+        # Last parsed view specifications, tagged with the metadata version and view files
+        self._views_cache: Optional[Tuple[Any, List[Dict[str, Any]]]] = None
+
+        # Static prompts keyed by a hash of every input they were built from
+        self.max_cached_prompts = 8
+        self._prompt_cache: Dict[str, Dict[str, Any]] = {}
+
     def generate_system_prompt(self, user_query_context: Optional[Dict[str, Any]] = None) -> Dict[str, Any]:
         """
         Generate comprehensive system prompt for OpenAI API integration.
 
+        The prompt is split into a static part (business context, views, examples)
+        and a dynamic part (user query context), so the static prefix stays
+        identical across queries for LLM prompt caching. The static part is
+        memoized per input signature: the same views, configuration, templates
+        and Cube metadata yield the cached prompt.
+
         Args:
             user_query_context: Optional context about the user's query for enhanced prompt generation
 
         Returns:
-            Dictionary containing the complete system prompt and metadata
+            Dictionary containing the complete system prompt, its static and
+            dynamic parts, and metadata
         """
         try:
-            # Step 1: Load business configuration
-            business_context = self.business_config.load_business_context()
-
-            # Step 2: Parse all YML view files
-            view_specifications = self._parse_cube_views()
-
-            # Step 3: Load query examples and patterns
-            examples_context = self.example_manager.load_all_examples()
-
-            # Step 4: Build the complete system prompt
-            system_prompt = self.prompt_builder.build_system_prompt({
-                'business_context': business_context,
-                'view_specifications': view_specifications,
-                'examples_context': examples_context,
-                'user_query_context': user_query_context
-            })
+            static_result = self._get_static_system_prompt()
+            system_prompt_dynamic = self.prompt_builder.build_user_query_context(user_query_context)
 
             return {
-                'system_prompt': system_prompt,
-                'metadata': {
-                    'views_count': len(view_specifications),
-                    'examples_count': len(examples_context.get('successful_queries', [])),
-                    'business_entities': len(business_context.get('entities', [])),
-                    'generation_timestamp': self._get_timestamp()
-                }
+                'system_prompt': static_result['system_prompt'] + system_prompt_dynamic,
+                'system_prompt_static': static_result['system_prompt'],
+                'system_prompt_dynamic': system_prompt_dynamic,
+                'metadata': dict(static_result['metadata'])
             }
 
         except Exception as e:
             raise ContextManagerError(f"Failed to generate system prompt: {str(e)}")
 
+    def _get_static_system_prompt(self) -> Dict[str, Any]:
+        """
+        Get the static system prompt, building it only when its inputs changed.
+
+        Returns:
+            Dictionary containing the static system prompt and metadata
+        """
+        cache_key = self._get_prompt_cache_key()
+        cached = self._prompt_cache.get(cache_key)
+        if cached is not None:
+            return cached
+
+        # Step 1: Load business configuration
+        business_context = self.business_config.load_business_context()
+
+        # Step 2: Parse all YML view files
+        view_specifications = self._parse_cube_views()
+
+        # Step 3: Load query examples and patterns
+        examples_context = self.example_manager.load_all_examples()
+
+        # Step 4: Build the complete system prompt
+        system_prompt = self.prompt_builder.build_system_prompt({
+            'business_context': business_context,
+            'view_specifications': view_specifications,
+            'examples_context': examples_context
+        })
+
+        result = {
+            'system_prompt': system_prompt,
+            'metadata': {
+                'views_count': len(view_specifications),
+                'examples_count': len(examples_context.get('successful_queries', [])),
+                'business_entities': len(business_context.get('entities', [])),
+                'generation_timestamp': self._get_timestamp()
+            }
+        }
+
+        if len(self._prompt_cache) >= self.max_cached_prompts:
+            # Evict the oldest entry (dicts keep insertion order)
+            del self._prompt_cache[next(iter(self._prompt_cache))]
+        self._prompt_cache[cache_key] = result
+
+        return result
+
+    def get_prompt_signature(self) -> str:
+        """
+        Identify the inputs of the static system prompt.
+
+        Equal signatures mean the Cube metadata, views, configuration and
+        template files are unchanged, so the prompt would be identical.
+
+        Returns:
+            Hex digest identifying the prompt inputs
+        """
+        return self._get_prompt_cache_key()
+
+    def _get_prompt_cache_key(self) -> str:
+        """
+        Build a cache key from everything the static system prompt depends on.
+
+        Returns:
+            Hex digest identifying the prompt inputs
+        """
+        signature = (
+            self._get_files_signature(self.views_path),
+            self._get_files_signature(self.config_path),
+            self._get_files_signature(self.templates_path),
+            self._get_files_signature(self.templates_path / "examples"),
+            self._get_metadata_version()
+        )
+        return hashlib.blake2b(repr(signature).encode('utf-8'), digest_size=16).hexdigest()
+
+    @staticmethod
+    def _get_files_signature(directory: Path) -> Tuple[Tuple[str, int, int], ...]:
+        """
+        Get name, mtime and size of the files in a directory.
+
+        Args:
+            directory: Directory to scan (not recursive)
+
+        Returns:
+            Sorted tuple of (name, mtime_ns, size), empty if the directory is missing
+        """
+        try:
+            with os.scandir(directory) as entries:
+                files = []
+                for entry in entries:
+                    if entry.is_file():
+                        stat = entry.stat()
+                        files.append((entry.name, stat.st_mtime_ns, stat.st_size))
+        except OSError:
+            return ()
+        return tuple(sorted(files))
+
+    def _get_metadata_version(self) -> Optional[str]:
+        """
+        Identify the loaded Cube metadata for cache keys.
+
+        Prefers the fetcher's content fingerprint, so a refresh that returns
+        identical metadata keeps the cached prompt; falls back to the fetch
+        timestamp for fetchers that do not compute one.
+
+        Returns:
+            Metadata fingerprint or timestamp, None without dynamic metadata
+        """
+        if not (self.use_dynamic_metadata and self.cube_metadata_fetcher):
+            return None
+        fetcher = self.cube_metadata_fetcher
+        return getattr(fetcher, 'metadata_fingerprint', None) or fetcher.metadata_timestamp
+
     def _parse_cube_views(self) -> List[Dict[str, Any]]:
         """
-        Parse cube views from either dynamic Cube metadata or static YML files.
+        Parse cube views, reusing the last result while its sources are unchanged.
+
+        Returns:
+            List of parsed view specifications
+        """
+        views_tag = (self._get_metadata_version(), self._get_files_signature(self.views_path))
+        if self._views_cache is not None and self._views_cache[0] == views_tag:
+            return self._views_cache[1]
+
+        view_specifications = self._load_cube_views()
+        self._views_cache = (views_tag, view_specifications)
+        return view_specifications
+
+    def _load_cube_views(self) -> List[Dict[str, Any]]:
+        """
+        Load cube views from either dynamic Cube metadata or static YML files.
 
         Returns:
             List of parsed view specifications
@@ -110,12 +234,12 @@ class ContextManager:
             try:
                 view_specifications = self._fetch_dynamic_cube_views()
                 if view_specifications:
-                    print(f"✅ Loaded {len(view_specifications)} views from Cube metadata API")
+                    logger.info("✅ Loaded %s views from Cube metadata API", len(view_specifications))
                     return view_specifications
                 else:
-                    print("⚠️  No views found in Cube metadata, falling back to YAML files")
+                    logger.warning("⚠️  No views found in Cube metadata, falling back to YAML files")
             except Exception as e:
-                print(f"⚠️  Failed to fetch dynamic metadata: {str(e)}, falling back to YAML files")
+                logger.warning("⚠️  Failed to fetch dynamic metadata: %s, falling back to YAML files", e)
 
         # Fallback to static YAML parsing
         return self._parse_static_yaml_views()
@@ -127,8 +251,6 @@ class ContextManager:
         Returns:
             List of view specifications in the same format as YAML parser
         """
-        view_specifications = []
-
         # Get all views metadata
         all_views_result = self.cube_metadata_fetcher.get_all_views_metadata()
 
@@ -136,35 +258,38 @@ class ContextManager:
             raise ContextManagerError(f"Failed to fetch views metadata: {all_views_result.get('error')}")
 
         # Convert Cube metadata format to view specification format
-        for view_data in all_views_result.get('views', []):
-            view_spec = {
+        return [
+            {
                 'name': view_data.get('view'),
                 'title': view_data.get('title', view_data.get('view')),
                 'description': view_data.get('description', ''),
                 'type': view_data.get('type', 'cube'),
-                'measures': [],
-                'dimensions': []
+                # Measures and dimensions with descriptions
+                'measures': self._build_field_specs(view_data.get('measures', ())),
+                'dimensions': self._build_field_specs(view_data.get('dimensions', ()))
             }
+            for view_data in all_views_result.get('views', ())
+        ]
 
-            # Add measures with descriptions
-            for measure in view_data.get('measures', []):
-                view_spec['measures'].append({
-                    'name': measure.get('name'),
-                    'title': measure.get('title', measure.get('name')),
-                    'description': measure.get('description', '')
-                })
-
-            # Add dimensions with descriptions
-            for dimension in view_data.get('dimensions', []):
-                view_spec['dimensions'].append({
-                    'name': dimension.get('name'),
-                    'title': dimension.get('title', dimension.get('name')),
-                    'description': dimension.get('description', '')
-                })
+    @staticmethod
+    def _build_field_specs(fields: List[Dict[str, Any]]) -> List[Dict[str, Any]]:
+        """
+        Convert Cube metadata measures or dimensions into view specification fields.
 
-            view_specifications.append(view_spec)
+        Args:
+            fields: Measure or dimension entries from the metadata fetcher
 
-        return view_specifications
+        Returns:
+            Field specifications with name, title and description
+        """
+        return [
+            {
+                'name': field.get('name'),
+                'title': field.get('title', field.get('name')),
+                'description': field.get('description', '')
+            }
+            for field in fields
+        ]
 
     def _parse_static_yaml_views(self) -> List[Dict[str, Any]]:
         """
@@ -175,22 +300,37 @@ class ContextManager:
         """
         view_specifications = []
 
-        if not self.views_path.exists():
-            return view_specifications
-
-        yml_files = list(self.views_path.glob("*.yml")) + list(self.views_path.glob("*.yaml"))
-
-        for yml_file in yml_files:
+        for yml_file in self._list_view_files():
             try:
                 parsed_view = self.yml_parser.parse_view_file(str(yml_file))
                 if parsed_view:
                     view_specifications.append(parsed_view)
             except Exception as e:
                 # Log warning but continue processing other files
-                print(f"Warning: Failed to parse {yml_file}: {str(e)}")
+                logger.warning("Failed to parse %s: %s", yml_file, e)
 
         return view_specifications
 
+    def _list_view_files(self) -> List[Path]:
+        """
+        List YML view files, rescanning only when the views directory changed.
+
+        Returns:
+            List of *.yml and *.yaml paths, empty if the directory does not exist
+        """
+        try:
+            mtime = self.views_path.stat().st_mtime_ns
+        except OSError:
+            self._view_files_mtime = None
+            self._view_files = []
+            return self._view_files
+
+        if mtime != self._view_files_mtime:
+            self._view_files = list_view_files(self.views_path)
+            self._view_files_mtime = mtime
+
+        return self._view_files
+
     def validate_context_setup(self) -> Dict[str, Any]:
         """
         Validate that all required files and configurations are properly set up.
@@ -206,15 +346,14 @@ class ContextManager:
 
         # Check required directories
         required_dirs = [self.views_path, self.templates_path, self.config_path]
-        for directory in required_dirs:
-            if not directory.exists():
-                validation_results['issues'].append(f"Missing directory: {directory}")
-                validation_results['status'] = 'invalid'
+        missing_dirs = [directory for directory in required_dirs if not directory.exists()]
+        for directory in missing_dirs:
+            validation_results['issues'].append(f"Missing directory: {directory}")
+            validation_results['status'] = 'invalid'
 
         # Check for YML view files
-        if self.views_path.exists():
-            yml_files = list(self.views_path.glob("*.yml")) + list(self.views_path.glob("*.yaml"))
-            if not yml_files:
+        if self.views_path not in missing_dirs:
+            if not self._list_view_files():
                 validation_results['warnings'].append("No YML view files found in my-cube-views directory")
 
         # Validate business configuration
@@ -245,7 +384,6 @@ class ContextManager:
 
     def _get_timestamp(self) -> str:
         """Get current timestamp for metadata."""
-        from datetime import datetime
         return datetime.now().isoformat()
 
 
@@ -1,13 +1,17 @@
 # ABOUTME: Manager for query examples and natural language to CUBE API patterns
 # ABOUTME: Loads and validates successful queries and NL patterns for LLM context
 
-from typing import Dict, List, Any, Optional
+from typing import Dict, FrozenSet, List, Any, Optional, Tuple
 from pathlib import Path
-
-import sys
 import os
-sys.path.append(os.path.join(os.path.dirname(__file__), '..', 'utils'))
-from file_loader import FileLoader
+import logging
+import heapq
+from operator import itemgetter
+from concurrent.futures import ThreadPoolExecutor
+
+from utils.file_loader import FileLoader
+
+logger = logging.getLogger(__name__)
 
 
 class ExampleManager:
@@ -31,6 +35,28 @@ class ExampleManager:
         self.nl_patterns_file = "nl_to_cube_patterns.yaml"
         self.ambiguous_examples_file = "ambiguous_query_examples.yaml"
 
+        # Word sets of each successful query's natural language text, rebuilt when the queries change
+        self._query_words_source: Optional[List[Dict[str, Any]]] = None
+        self._query_words: List[Tuple[FrozenSet[str], Dict[str, Any]]] = []
+
+        # Phrase word -> (category, pattern position) index over the NL patterns
+        self._pattern_index_source: Optional[Dict[str, List[Dict[str, Any]]]] = None
+        self._pattern_word_index: Dict[str, List[Tuple[str, int]]] = {}
+
+        # Last validation result, keyed by the examples directory fingerprint
+        self._validation_key: Optional[Tuple[Tuple[str, int], ...]] = None
+        self._validation_issues: List[str] = []
+
+        # Every prompt build needs all three files, so read and parse them up front
+        self._prefetch_examples()
+
+    def _prefetch_examples(self) -> None:
+        """Load the three example files concurrently into the file loader's cache."""
+        with ThreadPoolExecutor(max_workers=3) as executor:
+            executor.submit(self._load_successful_queries)
+            executor.submit(self._load_nl_patterns)
+            executor.submit(self._load_ambiguous_examples)
+
     def load_all_examples(self) -> Dict[str, Any]:
         """
         Load all example files and return organized examples context.
@@ -50,6 +76,45 @@ class ExampleManager:
 
         return examples_context
 
+    def _get_query_word_sets(self) -> List[Tuple[FrozenSet[str], Dict[str, Any]]]:
+        """
+        Get successful queries paired with their lowercased word sets.
+
+        Returns:
+            List of (word set, query) tuples, rebuilt only when the queries change
+        """
+        successful_queries = self._load_successful_queries()
+
+        if successful_queries != self._query_words_source:
+            self._query_words = [
+                (frozenset(query.get('natural_language', '').lower().split()), query)
+                for query in successful_queries
+            ]
+            self._query_words_source = successful_queries
+
+        return self._query_words
+
+    def _get_pattern_word_index(self) -> Dict[str, List[Tuple[str, int]]]:
+        """
+        Get an index from each distinct phrase word to the patterns using it.
+
+        Returns:
+            Dictionary of word -> list of (category, pattern position), rebuilt
+            only when the patterns change
+        """
+        nl_patterns = self._load_nl_patterns()
+
+        if nl_patterns != self._pattern_index_source:
+            word_index: Dict[str, List[Tuple[str, int]]] = {}
+            for category, patterns in nl_patterns.items():
+                for position, pattern in enumerate(patterns):
+                    for word in set(pattern.get('phrase', '').lower().split()):
+                        word_index.setdefault(word, []).append((category, position))
+            self._pattern_word_index = word_index
+            self._pattern_index_source = nl_patterns
+
+        return self._pattern_word_index
+
     def _load_successful_queries(self) -> List[Dict[str, Any]]:
         """
         Load successful query examples.
@@ -67,7 +132,7 @@ class ExampleManager:
             return content.get('queries', [])
 
         except Exception as e:
-            print(f"Warning: Failed to load successful queries: {str(e)}")
+            logger.warning("Failed to load successful queries: %s", e)
             return self._get_default_successful_queries()
 
     def _load_nl_patterns(self) -> Dict[str, List[Dict[str, Any]]]:
@@ -87,7 +152,7 @@ class ExampleManager:
             return content.get('patterns', {})
 
         except Exception as e:
-            print(f"Warning: Failed to load NL patterns: {str(e)}")
+            logger.warning("Failed to load NL patterns: %s", e)
             return self._get_default_nl_patterns()
 
     def _load_ambiguous_examples(self) -> List[Dict[str, Any]]:
@@ -107,7 +172,7 @@ class ExampleManager:
             return content.get('ambiguous_queries', [])
 
         except Exception as e:
-            print(f"Warning: Failed to load ambiguous examples: {str(e)}")
+            logger.warning("Failed to load ambiguous examples: %s", e)
             return self._get_default_ambiguous_examples()
 
     def _get_default_successful_queries(self) -> List[Dict[str, Any]]:
@@ -247,26 +312,20 @@ class ExampleManager:
         Returns:
             List of similar successful queries
         """
-        successful_queries = self._load_successful_queries()
-        similar_queries = []
+        scored_queries = []
 
         # Simple keyword matching (can be enhanced with NLP)
-        user_words = set(user_query.lower().split())
-
-        for query in successful_queries:
-            nl_text = query.get('natural_language', '').lower()
-            query_words = set(nl_text.split())
+        user_words = frozenset(user_query.lower().split())
 
+        for query_words, query in self._get_query_word_sets():
             # Calculate simple word overlap
-            overlap = len(user_words.intersection(query_words))
+            overlap = len(user_words & query_words)
             if overlap > 0:
-                query_copy = query.copy()
-                query_copy['similarity_score'] = overlap / len(user_words.union(query_words))
-                similar_queries.append(query_copy)
+                scored_queries.append((overlap / len(user_words | query_words), query))
 
-        # Sort by similarity score
-        similar_queries.sort(key=lambda x: x.get('similarity_score', 0), reverse=True)
-        return similar_queries[:3]  # Return top 3 similar queries
+        # Top 3 by similarity score, without sorting every match; only those get copied
+        top_queries = heapq.nlargest(3, scored_queries, key=itemgetter(0))
+        return [{**query, 'similarity_score': score} for score, query in top_queries]
 
     def get_pattern_suggestions(self, user_query: str) -> Dict[str, List[str]]:
         """
@@ -279,26 +338,57 @@ class ExampleManager:
             Dictionary of relevant patterns
         """
         nl_patterns = self._load_nl_patterns()
-        suggestions = {}
+        word_index = self._get_pattern_word_index()
 
         query_lower = user_query.lower()
 
-        for category, patterns in nl_patterns.items():
-            matching_patterns = []
-            for pattern in patterns:
-                phrase = pattern.get('phrase', '').lower()
-                if any(word in query_lower for word in phrase.split()):
-                    matching_patterns.append(pattern)
-
-            if matching_patterns:
-                suggestions[category] = matching_patterns
+        # Test each distinct phrase word once, then map hits back to their patterns
+        matched: Dict[str, set] = {}
+        for word, pattern_refs in word_index.items():
+            if word in query_lower:
+                for category, position in pattern_refs:
+                    matched.setdefault(category, set()).add(position)
 
-        return suggestions
+        return {
+            category: [patterns[position] for position in sorted(matched[category])]
+            for category, patterns in nl_patterns.items()
+            if category in matched
+        }
 
     def validate_examples(self) -> List[str]:
         """
         Validate all example files and return any issues found.
 
+        The result is reused until a file in the examples directory changes.
+
+        Returns:
+            List of validation issues
+        """
+        validation_key = self._get_examples_fingerprint()
+
+        if validation_key is None or validation_key != self._validation_key:
+            self._validation_issues = self._run_validation()
+            self._validation_key = validation_key
+
+        return list(self._validation_issues)
+
+    def _get_examples_fingerprint(self) -> Optional[Tuple[Tuple[str, int], ...]]:
+        """
+        Get the name and mtime of every file in the examples directory.
+
+        Returns:
+            Sorted tuple of (name, mtime_ns), or None if the directory is missing
+        """
+        try:
+            with os.scandir(self.examples_path) as entries:
+                return tuple(sorted((entry.name, entry.stat().st_mtime_ns) for entry in entries))
+        except OSError:
+            return None
+
+    def _run_validation(self) -> List[str]:
+        """
+        Run the example file checks.
+
         Returns:
             List of validation issues
         """
@@ -1,21 +1,43 @@
 # ABOUTME: Enhanced prompt builder with ambiguity handling for LLM integration
 # ABOUTME: Constructs comprehensive system prompts using templates, business context, and examples
 
-from typing import Dict, List, Any, Optional
+import functools
+import io
+from string import Formatter
+from typing import Dict, List, Any, Optional, Tuple
 from pathlib import Path
 
-import sys
-import os
-sys.path.append(os.path.join(os.path.dirname(__file__), '..'))
+import orjson
+
 from utils.file_loader import FileLoader
 
 
+@functools.lru_cache(maxsize=64)
+def _title_case(text: str) -> str:
+    """Title-case a pattern category name; categories are a small fixed set."""
+    return text.title()
+
+
 class PromptBuilder:
     """
     Enhanced prompt builder that constructs comprehensive system prompts.
     Handles template loading, context integration, and ambiguity handling instructions.
     """
 
+    __slots__ = (
+        'templates_path', 'file_loader',
+        'base_template', 'business_template', 'api_instructions', 'ambiguity_instructions',
+        '_template_cache', '_compiled_templates', '_template_present',
+    )
+
+    # Pattern keys in priority order, with the description format for each
+    _PATTERN_DESCRIPTIONS = (
+        ('cube_measure', "measure: {}"),
+        ('cube_dimension', "dimension: {}"),
+        ('cube_filter', "filter/time dimension"),
+        ('cube_operator', "operator: {}"),
+    )
+
     def __init__(self, templates_path: str):
         """
         Initialize the prompt builder with templates directory path.
@@ -32,6 +54,26 @@ class PromptBuilder:
         self.api_instructions = "cube_api_instructions.txt"
         self.ambiguity_instructions = "ambiguity_instructions.txt"
 
+        # Template contents keyed by name, stored with the file mtime they were read at
+        self._template_cache: Dict[str, Tuple[Optional[int], str]] = {}
+
+        # Parsed placeholder layout of each template, keyed by name with the source text it came from
+        self._compiled_templates: Dict[str, Tuple[str, Optional[List[Tuple[str, Optional[str]]]]]] = {}
+
+        # Which required templates exist; checked once here and on refresh_templates()
+        self._template_present: Dict[str, bool] = {}
+        self.refresh_templates()
+
+    def refresh_templates(self) -> None:
+        """Re-check which templates exist and drop cached template contents."""
+        self._template_cache.clear()
+        self._compiled_templates.clear()
+        self._template_present = {
+            template: (self.templates_path / template).exists()
+            for template in (self.base_template, self.api_instructions,
+                             self.ambiguity_instructions, self.business_template)
+        }
+
     def build_system_prompt(self, context: Dict[str, Any]) -> str:
         """
         Build complete system prompt using all available context.
@@ -43,9 +85,6 @@ class PromptBuilder:
             Complete system prompt string
         """
         try:
-            # Load base template
-            base_template = self._load_template(self.base_template)
-
             # Prepare all context sections
             sections = {
                 'business_context': self._build_business_context(context.get('business_context', {})),
@@ -57,13 +96,35 @@ class PromptBuilder:
             }
 
             # Replace placeholders in base template
-            system_prompt = base_template.format(**sections)
+            system_prompt = self._render_template(self.base_template, sections)
 
             return system_prompt
 
         except Exception as e:
             raise PromptBuilderError(f"Failed to build system prompt: {str(e)}")
 
+    def build_user_query_context(self, user_query_context: Optional[Dict[str, Any]]) -> str:
+        """
+        Build the per-query section appended after the static system prompt.
+
+        Kept separate from build_system_prompt so the large static prefix stays
+        byte-identical across requests and benefits from LLM prompt caching.
+
+        Args:
+            user_query_context: Optional context about the user's query
+
+        Returns:
+            Formatted query context section, empty if there is no context
+        """
+        if not user_query_context:
+            return ""
+
+        lines = ["\n\n# CURRENT QUERY CONTEXT\n"]
+        for key, value in user_query_context.items():
+            lines.append(f"- **{key}**: {value}")
+
+        return "\n".join(lines)
+
     def _load_template(self, template_name: str) -> str:
         """
         Load a template file.
@@ -76,10 +137,72 @@ class PromptBuilder:
         """
         template_path = self.templates_path / template_name
 
-        if not template_path.exists():
-            return f"# Template {template_name} not found"
+        try:
+            mtime = template_path.stat().st_mtime_ns
+        except OSError:
+            mtime = None
+
+        cached = self._template_cache.get(template_name)
+        if cached is not None and cached[0] == mtime:
+            return cached[1]
+
+        if mtime is None:
+            content = f"# Template {template_name} not found"
+        else:
+            # Already stat'ed above, so read directly without FileLoader's checks
+            content = template_path.read_text(encoding='utf-8')
+
+        self._template_cache[template_name] = (mtime, content)
+        return content
+
+    def _render_template(self, template_name: str, values: Dict[str, str]) -> str:
+        """
+        Fill a template's placeholders using its pre-parsed layout.
+
+        The template is split into literal/field segments once per template
+        version, so each render is a plain join instead of a str.format parse.
+        Templates using conversions or format specs fall back to str.format.
+
+        Args:
+            template_name: Name of the template file
+            values: Replacement values keyed by placeholder name
+
+        Returns:
+            Rendered template string
+        """
+        template = self._load_template(template_name)
+
+        compiled = self._compiled_templates.get(template_name)
+        if compiled is None or compiled[0] is not template:
+            compiled = (template, self._compile_template(template))
+            self._compiled_templates[template_name] = compiled
 
-        return self.file_loader.load_text_file(str(template_path))
+        segments = compiled[1]
+        if segments is None:
+            return template.format(**values)
+
+        return "".join(
+            literal + values[field_name] if field_name is not None else literal
+            for literal, field_name in segments
+        )
+
+    @staticmethod
+    def _compile_template(template: str) -> Optional[List[Tuple[str, Optional[str]]]]:
+        """
+        Split a template into (literal, field name) segments.
+
+        Args:
+            template: Template text using str.format placeholders
+
+        Returns:
+            List of segments, or None if the template needs full str.format handling
+        """
+        segments = []
+        for literal, field_name, format_spec, conversion in Formatter().parse(template):
+            if field_name is not None and (format_spec or conversion or not field_name.isidentifier()):
+                return None
+            segments.append((literal, field_name))
+        return segments
 
     def _build_business_context(self, business_context: Dict[str, Any]) -> str:
         """
@@ -94,9 +217,6 @@ class PromptBuilder:
         try:
             domain_info = business_context.get('domain_info', {})
 
-            # Load business context template
-            template = self._load_template(self.business_template)
-
             # Prepare template variables
             variables = {
                 'business_name': domain_info.get('business_name', 'Event Management System'),
@@ -107,7 +227,7 @@ class PromptBuilder:
                 'common_questions_section': self._format_questions(domain_info.get('common_questions', []))
             }
 
-            return template.format(**variables)
+            return self._render_template(self.business_template, variables)
 
         except Exception as e:
             return f"# Business context error: {str(e)}"
@@ -125,42 +245,52 @@ class PromptBuilder:
         if not view_specifications:
             return "# No view specifications available"
 
-        sections = ["# CUBE VIEW SPECIFICATIONS\n"]
+        # Each line after the header is written with its leading newline
+        buf = io.StringIO()
+        w = buf.write
+        w("# CUBE VIEW SPECIFICATIONS\n")
 
         for view in view_specifications:
             view_name = view.get('name', 'Unknown View')
             description = view.get('description', 'No description available')
+            dimensions = view.get('dimensions', [])
+            measures = view.get('measures', [])
 
-            sections.append(f"## {view_name}")
-            sections.append(f"**Description**: {description}\n")
+            w(f"\n## {view_name}\n**Description**: {description}\n")
 
             # Add dimensions
-            dimensions = view.get('dimensions', [])
             if dimensions:
-                sections.append("**Available Dimensions:**")
-                for dim in dimensions:
-                    dim_name = dim.get('name', 'unknown')
-                    dim_desc = dim.get('description', '')
-                    if dim_desc:
-                        sections.append(f"- `{view_name}.{dim_name}`: {dim_desc}")
-                    else:
-                        sections.append(f"- `{view_name}.{dim_name}`")
-                sections.append("")
+                w("\n**Available Dimensions:**")
+                w(self._format_field_lines(view_name, dimensions))
+                w("\n")
 
             # Add measures
-            measures = view.get('measures', [])
             if measures:
-                sections.append("**Available Measures:**")
-                for measure in measures:
-                    measure_name = measure.get('name', 'unknown')
-                    measure_desc = measure.get('description', '')
-                    if measure_desc:
-                        sections.append(f"- `{view_name}.{measure_name}`: {measure_desc}")
-                    else:
-                        sections.append(f"- `{view_name}.{measure_name}`")
-                sections.append("")
-
-        return "\n".join(sections)
+                w("\n**Available Measures:**")
+                w(self._format_field_lines(view_name, measures))
+                w("\n")
+
+        return buf.getvalue()
+
+    @staticmethod
+    def _format_field_lines(view_name: str, fields: List[Dict[str, Any]]) -> str:
+        """
+        Format one bullet line per field, each with a leading newline.
+
+        Args:
+            view_name: View the fields belong to
+            fields: Dimension or measure specifications
+
+        Returns:
+            Concatenated field lines
+        """
+        prefix = f"\n- `{view_name}."
+        return "".join(
+            f"{prefix}{field.get('name', 'unknown')}`: {field['description']}"
+            if field.get('description')
+            else f"{prefix}{field.get('name', 'unknown')}`"
+            for field in fields
+        )
 
     def _build_examples_section(self, examples_context: Dict[str, Any]) -> str:
         """
@@ -177,7 +307,9 @@ class PromptBuilder:
         if not successful_queries:
             return "# No successful query examples available"
 
-        sections = ["# SUCCESSFUL QUERY EXAMPLES\n"]
+        buf = io.StringIO()
+        w = buf.write
+        w("# SUCCESSFUL QUERY EXAMPLES\n")
 
         for example in successful_queries:
             name = example.get('name', 'Unnamed Query')
@@ -185,17 +317,15 @@ class PromptBuilder:
             cube_query = example.get('cube_query', {})
             description = example.get('description', '')
 
-            sections.append(f"## {name}")
+            w(f"\n## {name}")
             if description:
-                sections.append(f"**Purpose**: {description}")
+                w(f"\n**Purpose**: {description}")
 
-            sections.append(f"**Natural Language**: \"{nl_query}\"")
-            sections.append("**CUBE Query**:")
-            sections.append("```json")
-            sections.append(self._format_json(cube_query))
-            sections.append("```\n")
+            w(f"\n**Natural Language**: \"{nl_query}\"\n**CUBE Query**:\n```json\n")
+            w(self._format_json(cube_query))
+            w("\n```\n")
 
-        return "\n".join(sections)
+        return buf.getvalue()
 
     def _build_patterns_section(self, examples_context: Dict[str, Any]) -> str:
         """
@@ -212,19 +342,21 @@ class PromptBuilder:
         if not nl_patterns:
             return "# No natural language patterns available"
 
-        sections = ["# NATURAL LANGUAGE PATTERNS\n"]
+        buf = io.StringIO()
+        w = buf.write
+        w("# NATURAL LANGUAGE PATTERNS\n")
 
         for category, patterns in nl_patterns.items():
-            sections.append(f"## {category.title()} Patterns")
+            w(f"\n## {_title_case(category)} Patterns")
 
             for pattern in patterns:
                 phrase = pattern.get('phrase', '')
                 if phrase:
-                    sections.append(f"- \"{phrase}\" → {self._describe_pattern(pattern)}")
+                    w(f"\n- \"{phrase}\" → {self._describe_pattern(pattern)}")
 
-            sections.append("")
+            w("\n")
 
-        return "\n".join(sections)
+        return buf.getvalue()
 
     def _format_entities(self, entities: List[Dict[str, Any]]) -> str:
         """Format business entities for template."""
@@ -261,23 +393,16 @@ class PromptBuilder:
 
     def _describe_pattern(self, pattern: Dict[str, Any]) -> str:
         """Describe a natural language pattern."""
-        if 'cube_measure' in pattern:
-            return f"measure: {pattern['cube_measure']}"
-        elif 'cube_dimension' in pattern:
-            return f"dimension: {pattern['cube_dimension']}"
-        elif 'cube_filter' in pattern:
-            return "filter/time dimension"
-        elif 'cube_operator' in pattern:
-            return f"operator: {pattern['cube_operator']}"
-        else:
-            return "pattern mapping"
+        for key, description in self._PATTERN_DESCRIPTIONS:
+            if key in pattern:
+                return description.format(pattern[key])
+        return "pattern mapping"
 
     def _format_json(self, data: Any) -> str:
         """Format data as JSON string."""
-        import json
         try:
-            return json.dumps(data, indent=2)
-        except Exception:
+            return orjson.dumps(data, option=orjson.OPT_INDENT_2 | orjson.OPT_NON_STR_KEYS).decode()
+        except orjson.JSONEncodeError:
             return str(data)
 
     def build_context_summary(self, context: Dict[str, Any]) -> Dict[str, Any]:
@@ -290,21 +415,32 @@ class PromptBuilder:
         Returns:
             Summary of context components
         """
+        business_context = context.get('business_context') or {}
+        domain_info = business_context.get('domain_info') or {}
+        view_specs = context.get('view_specifications') or ()
+        examples_context = context.get('examples_context') or {}
+
+        # Count dimensions and measures in one pass over the views
+        total_dimensions = total_measures = 0
+        for view in view_specs:
+            total_dimensions += len(view.get('dimensions', ()))
+            total_measures += len(view.get('measures', ()))
+
         return {
             'business_context': {
-                'has_domain_info': bool(context.get('business_context', {}).get('domain_info')),
-                'entities_count': len(context.get('business_context', {}).get('domain_info', {}).get('entities', [])),
-                'metrics_count': len(context.get('business_context', {}).get('domain_info', {}).get('key_metrics', []))
+                'has_domain_info': bool(domain_info),
+                'entities_count': len(domain_info.get('entities', ())),
+                'metrics_count': len(domain_info.get('key_metrics', ()))
             },
             'view_specifications': {
-                'views_count': len(context.get('view_specifications', [])),
-                'total_dimensions': sum(len(view.get('dimensions', [])) for view in context.get('view_specifications', [])),
-                'total_measures': sum(len(view.get('measures', [])) for view in context.get('view_specifications', []))
+                'views_count': len(view_specs),
+                'total_dimensions': total_dimensions,
+                'total_measures': total_measures
             },
             'examples_context': {
-                'successful_queries': len(context.get('examples_context', {}).get('successful_queries', [])),
-                'pattern_categories': len(context.get('examples_context', {}).get('nl_patterns', {})),
-                'ambiguous_examples': len(context.get('examples_context', {}).get('ambiguous_examples', []))
+                'successful_queries': len(examples_context.get('successful_queries', ())),
+                'pattern_categories': len(examples_context.get('nl_patterns', ())),
+                'ambiguous_examples': len(examples_context.get('ambiguous_examples', ()))
             }
         }
 
@@ -338,8 +474,7 @@ class PromptBuilder:
         # Check template files
         required_templates = [self.base_template, self.api_instructions, self.ambiguity_instructions]
         for template in required_templates:
-            template_path = self.templates_path / template
-            if not template_path.exists():
+            if not self._template_present[template]:
                 issues.append(f"Missing template file: {template}")
 
         return issues
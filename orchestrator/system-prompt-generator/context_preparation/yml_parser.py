@@ -1,9 +1,50 @@
 # ABOUTME: Parser for CUBE view YML files in my-cube-views directory
 # ABOUTME: Validates and extracts semantic layer specifications from YML files
 
-from typing import Dict, List, Any, Optional
+from typing import Dict, List, Any, Optional, Tuple
+import os
 import yaml
 from pathlib import Path
+import logging
+import re
+
+logger = logging.getLogger(__name__)
+
+# Prefer the libyaml-backed loader; fall back to the pure-Python one when
+# PyYAML was built without libyaml
+try:
+    from yaml import CSafeLoader as _YamlLoader
+except ImportError:
+    from yaml import SafeLoader as _YamlLoader
+    logger.debug("PyYAML built without libyaml; using the pure-Python SafeLoader")
+
+# Parsed views keyed by resolved path, stored with the mtime_ns they were parsed at
+# so an edited file replaces its entry; callers treat the results as read-only
+_PARSE_CACHE: Dict[str, Tuple[int, Dict[str, Any]]] = {}
+
+
+def list_view_files(directory: Path) -> List[Path]:
+    """
+    List the *.yml and *.yaml view files in a directory.
+
+    Matches the extensions case-sensitively and skips hidden files, like glob does.
+
+    Args:
+        directory: Directory to scan (not recursive)
+
+    Returns:
+        Paths of the view files, in directory order
+
+    Raises:
+        OSError: If the directory cannot be read
+    """
+    with os.scandir(directory) as entries:
+        return [
+            Path(entry.path) for entry in entries
+            if entry.name.endswith(('.yml', '.yaml'))
+            and not entry.name.startswith('.')
+            and entry.is_file()
+        ]
 
 
 class YMLParser:
@@ -12,6 +53,11 @@ class YMLParser:
     Handles validation and extraction of view specifications.
     """
 
+    __slots__ = ('required_view_fields', 'optional_view_fields')
+
+    # Field names containing any of these terms are classified as measures
+    _MEASURE_RE = re.compile(r'total_|avg_|count|value', re.IGNORECASE)
+
     def __init__(self):
         """Initialize the YML parser with validation rules."""
         self.required_view_fields = ['name']  # Make sql optional for views
@@ -30,20 +76,28 @@ class YMLParser:
         try:
             file_path = Path(file_path)
 
-            if not file_path.exists():
+            try:
+                stat = file_path.stat()
+            except OSError:
                 raise YMLParserError(f"File not found: {file_path}")
 
             if not file_path.suffix.lower() in ['.yml', '.yaml']:
                 raise YMLParserError(f"Invalid file extension: {file_path.suffix}")
 
-            with open(file_path, 'r', encoding='utf-8') as file:
-                content = yaml.safe_load(file)
+            cache_key = str(file_path.resolve())
+            cached = _PARSE_CACHE.get(cache_key)
+            if cached is not None and cached[0] == stat.st_mtime_ns:
+                return cached[1]
+
+            # Hand raw bytes to the loader; libyaml decodes UTF-8 itself
+            content = yaml.load(file_path.read_bytes(), Loader=_YamlLoader)
 
             if not content:
                 raise YMLParserError("Empty YML file")
 
             # Parse and validate the view specification
             parsed_view = self._parse_view_content(content, str(file_path))
+            _PARSE_CACHE[cache_key] = (stat.st_mtime_ns, parsed_view)
             return parsed_view
 
         except yaml.YAMLError as e:
@@ -81,14 +135,14 @@ class YMLParser:
                 includes = cube.get('includes', [])
                 for include in includes:
                     if isinstance(include, dict):
-                        field_name = include.get('name', include.get('alias', 'unknown'))
+                        field_name = include.get('name') or include.get('alias') or 'unknown'
                         alias = include.get('alias', field_name)
                     else:
                         field_name = str(include)
                         alias = field_name
 
                     # Classify as dimension or measure based on common patterns
-                    if any(term in field_name.lower() for term in ['total_', 'avg_', 'count', 'value']):
+                    if self._MEASURE_RE.search(field_name):
                         measures_list.append({'name': alias, 'type': 'number', 'sql': field_name})
                     else:
                         dimensions_list.append({'name': alias, 'type': 'string', 'sql': field_name})
@@ -242,17 +296,16 @@ class YMLParser:
         if not directory.exists():
             raise YMLParserError(f"Directory not found: {directory_path}")
 
-        yml_files = list(directory.glob("*.yml")) + list(directory.glob("*.yaml"))
         parsed_views = []
 
-        for yml_file in yml_files:
+        for yml_file in list_view_files(directory):
             try:
                 parsed_view = self.parse_view_file(str(yml_file))
                 if parsed_view:
                     parsed_views.append(parsed_view)
             except YMLParserError as e:
                 # Log warning but continue with other files
-                print(f"Warning: {str(e)}")
+                logger.warning("%s", e)
 
         return parsed_views
 
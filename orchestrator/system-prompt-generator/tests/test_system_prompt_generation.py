@@ -12,6 +12,8 @@ sys.path.append(os.path.join(os.path.dirname(__file__), '..'))
 # Import modules directly
 from context_preparation.context_manager import ContextManager, ContextManagerError
 
+_RULE = "=" * 80
+
 
 def main():
     """Test the system prompt generation with the current YML file."""
@@ -51,13 +53,17 @@ def main():
 
         output_file = results_dir / f"system_prompt_{timestamp}.txt"
 
+        header = (
+            "# SYSTEM PROMPT GENERATION TEST\n"
+            f"# Generated: {datetime.now().isoformat()}\n"
+            f"# Metadata: {metadata}\n"
+            f"\n{_RULE}\n"
+            "# GENERATED SYSTEM PROMPT\n"
+            f"{_RULE}\n\n"
+        )
+
         with open(output_file, 'w', encoding='utf-8') as f:
-            f.write("# SYSTEM PROMPT GENERATION TEST\n")
-            f.write(f"# Generated: {datetime.now().isoformat()}\n")
-            f.write(f"# Metadata: {metadata}\n")
-            f.write("\n" + "="*80 + "\n")
-            f.write("# GENERATED SYSTEM PROMPT\n")
-            f.write("="*80 + "\n\n")
+            f.write(header)
             f.write(system_prompt)
 
         print(f"💾 System prompt saved to: {output_file}")
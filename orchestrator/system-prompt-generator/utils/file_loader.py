@@ -1,12 +1,20 @@
 # ABOUTME: File system utilities for loading templates and configuration files
 # ABOUTME: Provides safe file reading and validation for the LLM integration system
 
-from typing import Dict, List, Any, Optional
+from typing import Dict, List, Any, Optional, Tuple
+import copy
 import os
 import yaml
 import json
 from pathlib import Path
 
+# Prefer the libyaml-backed loader; fall back to the pure-Python one when
+# PyYAML was built without libyaml
+try:
+    from yaml import CSafeLoader as _YamlLoader
+except ImportError:
+    from yaml import SafeLoader as _YamlLoader
+
 
 class FileLoader:
     """
@@ -16,7 +24,8 @@ class FileLoader:
 
     def __init__(self):
         """Initialize the file loader."""
-        pass
+        # Parsed YAML keyed by path, stored with the (mtime_ns, size) it was parsed at
+        self._yaml_cache: Dict[str, Tuple[Tuple[int, int], Any]] = {}
 
     def load_text_file(self, file_path: str, encoding: str = 'utf-8') -> str:
         """
@@ -47,6 +56,9 @@ class FileLoader:
         """
         Load a YAML file and return parsed content.
 
+        Parsed content is cached and reused while the file's mtime and size are
+        unchanged. Each call returns its own deep copy, so callers may modify it.
+
         Args:
             file_path: Path to the YAML file
 
@@ -56,22 +68,35 @@ class FileLoader:
         try:
             file_path = Path(file_path)
 
-            if not file_path.exists():
+            try:
+                stat = file_path.stat()
+            except FileNotFoundError:
                 raise FileLoaderError(f"YAML file not found: {file_path}")
 
+            cache_key = str(file_path)
+            signature = (stat.st_mtime_ns, stat.st_size)
+            cached = self._yaml_cache.get(cache_key)
+            if cached is not None and cached[0] == signature:
+                return copy.deepcopy(cached[1])
+
             with open(file_path, 'r', encoding='utf-8') as file:
-                content = yaml.safe_load(file)
+                content = yaml.load(file, Loader=_YamlLoader)
 
             if content is None:
-                return {}
+                content = {}
 
-            return content
+            self._yaml_cache[cache_key] = (signature, content)
+            return copy.deepcopy(content)
 
         except yaml.YAMLError as e:
             raise FileLoaderError(f"YAML parsing error in {file_path}: {str(e)}")
         except Exception as e:
             raise FileLoaderError(f"Failed to load YAML file {file_path}: {str(e)}")
 
+    def clear_cache(self) -> None:
+        """Drop cached YAML content so the next load re-reads every file."""
+        self._yaml_cache.clear()
+
     def load_json_file(self, file_path: str) -> Dict[str, Any]:
         """
         Load a JSON file and return parsed content.
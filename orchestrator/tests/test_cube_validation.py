@@ -11,12 +11,21 @@ sys.path.insert(0, str(Path(__file__).parent.parent))
 
 from cube_query_validator import CubeQueryValidator, CubeQueryValidatorError
 
+_RULE = "=" * 70
+_THIN_RULE = "-" * 70
+_BANNER = (
+    "\n\n"
+    "╔" + "=" * 68 + "╗\n"
+    "║" + " " * 15 + "CUBE QUERY VALIDATOR TEST SUITE" + " " * 21 + "║\n"
+    "╚" + "=" * 68 + "╝\n"
+)
+
 
 def test_validator_initialization():
     """Test that validator initializes correctly."""
-    print("=" * 70)
+    print(_RULE)
     print("TEST 1: Validator Initialization")
-    print("=" * 70)
+    print(_RULE)
 
     view_yml_path = Path(__file__).parent.parent / 'system-prompt-generator' / 'my-cube-views' / 'event_performance_overview.yml'
 
@@ -39,9 +48,9 @@ def test_validator_initialization():
 
 def test_valid_query(validator):
     """Test validation of a correct query."""
-    print("\n" + "=" * 70)
+    print("\n" + _RULE)
     print("TEST 2: Valid Query Validation")
-    print("=" * 70)
+    print(_RULE)
 
     valid_query = {
         "measures": ["FactOrders.tickets_sold"],
@@ -71,9 +80,9 @@ def test_valid_query(validator):
 
 def test_invalid_measure(validator):
     """Test validation of query with invalid measure."""
-    print("\n" + "=" * 70)
+    print("\n" + _RULE)
     print("TEST 3: Invalid Measure Detection")
-    print("=" * 70)
+    print(_RULE)
 
     invalid_query = {
         "measures": ["EventPerformanceOverview.total_tickets_sold"],  # Wrong: should be tickets_sold
@@ -104,9 +113,9 @@ def test_invalid_measure(validator):
 
 def test_correction_prompt(validator):
     """Test generation of correction prompt."""
-    print("\n" + "=" * 70)
+    print("\n" + _RULE)
     print("TEST 4: Correction Prompt Generation")
-    print("=" * 70)
+    print(_RULE)
 
     invalid_query = {
         "measures": ["EventPerformanceOverview.total_tickets_sold"],
@@ -120,9 +129,9 @@ def test_correction_prompt(validator):
     if not result['valid']:
         correction_prompt = validator.generate_correction_prompt(result, original_user_query)
         print(f"\nGenerated Correction Prompt:")
-        print("-" * 70)
+        print(_THIN_RULE)
         print(correction_prompt)
-        print("-" * 70)
+        print(_THIN_RULE)
         print("✓ Correction prompt generated successfully")
         return True
     else:
@@ -132,9 +141,9 @@ def test_correction_prompt(validator):
 
 def test_mixed_valid_invalid(validator):
     """Test query with mix of valid and invalid parameters."""
-    print("\n" + "=" * 70)
+    print("\n" + _RULE)
     print("TEST 5: Mixed Valid/Invalid Parameters")
-    print("=" * 70)
+    print(_RULE)
 
     mixed_query = {
         "measures": [
@@ -167,11 +176,7 @@ def test_mixed_valid_invalid(validator):
 
 def main():
     """Run all tests."""
-    print("\n")
-    print("╔" + "=" * 68 + "╗")
-    print("║" + " " * 15 + "CUBE QUERY VALIDATOR TEST SUITE" + " " * 21 + "║")
-    print("╚" + "=" * 68 + "╝")
-    print()
+    print(_BANNER)
 
     # Test 1: Initialize validator
     validator = test_validator_initialization()
@@ -192,9 +197,9 @@ def main():
     test5_passed = test_mixed_valid_invalid(validator)
 
     # Summary
-    print("\n" + "=" * 70)
+    print("\n" + _RULE)
     print("TEST SUMMARY")
-    print("=" * 70)
+    print(_RULE)
     tests_passed = sum([test2_passed, test3_passed, test4_passed, test5_passed])
     total_tests = 4
     print(f"\nPassed: {tests_passed}/{total_tests}")
@@ -3,8 +3,12 @@
 
 import os
 import sys
+import json
+import functools
 from pathlib import Path
 
+import orjson
+
 # Load environment variables
 try:
     from dotenv import load_dotenv
@@ -21,6 +25,11 @@ except ImportError:
     print("❌ OpenAI package not installed. Run: pip install openai")
     sys.exit(1)
 
+@functools.lru_cache(maxsize=1)
+def _client():
+    """Create the OpenAI client once so all tests share its connection pool."""
+    return openai.OpenAI()
+
 
 def test_api_key():
     """Test if API key is properly configured."""
@@ -45,7 +54,7 @@ def test_basic_connection():
     print("\n🌐 Testing Basic API Connection...")
 
     try:
-        client = openai.OpenAI()
+        client = _client()
 
         # Simple test call
         response = client.chat.completions.create(
@@ -78,7 +87,7 @@ def test_gpt4_access():
     print("\n🧠 Testing GPT-4 Model Access...")
 
     try:
-        client = openai.OpenAI()
+        client = _client()
 
         response = client.chat.completions.create(
             model="gpt-4",
@@ -108,7 +117,7 @@ def test_json_response():
     print("\n📋 Testing JSON Response Format...")
 
     try:
-        client = openai.OpenAI()
+        client = _client()
 
         response = client.chat.completions.create(
             model="gpt-4",
@@ -119,9 +128,8 @@ def test_json_response():
             max_tokens=50
         )
 
-        import json
         content = response.choices[0].message.content
-        parsed_json = json.loads(content)
+        parsed_json = orjson.loads(content)
 
         print("✅ JSON response format successful")
         print(f"   Raw response: {content}")
@@ -142,7 +150,7 @@ def test_orchestrator_like_request():
     print("\n🎯 Testing Orchestrator-like Request...")
 
     try:
-        client = openai.OpenAI()
+        client = _client()
 
         # Simulate orchestrator request
         system_prompt = """You are an expert data analyst. Convert natural language to CUBE API queries.
@@ -163,16 +171,17 @@ def test_orchestrator_like_request():
             {"role": "user", "content": "Show me total revenue by event"}
         ]
 
+        # Same model and JSON mode as LLMClient; the expected reply is ~100 tokens
         response = client.chat.completions.create(
-            model="gpt-4",
+            model="gpt-4o",
             messages=messages,
             temperature=0.1,
-            max_tokens=500
+            max_tokens=200,
+            response_format={"type": "json_object"}
         )
 
-        import json
         content = response.choices[0].message.content
-        parsed_json = json.loads(content)
+        parsed_json = orjson.loads(content)
 
         print("✅ Orchestrator-like request successful")
         print(f"   Response type: {parsed_json.get('response_type')}")
@@ -198,6 +207,9 @@ def main():
         ("Orchestrator-like Request", test_orchestrator_like_request)
     ]
 
+    # Later tests cannot pass without these, so a failure skips the rest
+    prerequisites = {"API Key Configuration", "Basic Connection"}
+
     results = {}
 
     for test_name, test_func in tests:
@@ -210,6 +222,10 @@ def main():
             print(f"\n❌ Test '{test_name}' crashed: {str(e)}")
             results[test_name] = False
 
+        if test_name in prerequisites and not results[test_name]:
+            print(f"\n⏭️  Skipping remaining tests: '{test_name}' failed")
+            break
+
     # Summary
     print(f"\n📊 TEST SUMMARY")
     print("-" * 25)
@@ -4,14 +4,50 @@
 import sys
 import os
 from pathlib import Path
-import json
 from datetime import datetime
 
+import orjson
+
+# Importing readline gives input() line editing and arrow-up recall of
+# earlier questions; it is unavailable on some platforms (e.g. Windows)
+try:
+    import readline
+except ImportError:
+    readline = None
+
 # Add parent directory to path for imports
 sys.path.append(os.path.join(os.path.dirname(__file__), '..'))
 
 from orchestrator import QueryOrchestrator, QueryOrchestratorError
 
+# Answers recognised at the interactive prompts
+CANCEL_WORDS = frozenset({'exit', 'quit', 'cancel'})
+YES_WORDS = frozenset({'y', 'yes'})
+
+# Longest value shown per column in the row preview (the CSV keeps full values)
+MAX_PREVIEW_VALUE_CHARS = 40
+
+
+def _read_answer(prompt: str) -> str:
+    """
+    Read a y/n style answer and keep it out of readline history.
+
+    readline records every line typed at input(), so without this arrow-up
+    would step through confirmations instead of earlier questions.
+
+    Args:
+        prompt: Prompt to display
+
+    Returns:
+        Answer stripped and lowercased
+    """
+    line = input(prompt)
+    if readline is not None:
+        length = readline.get_current_history_length()
+        if length and readline.get_history_item(length) == line:
+            readline.remove_history_item(length - 1)
+    return line.strip().lower()
+
 
 class OrchestratorInteractiveTest:
     """
@@ -50,10 +86,12 @@ class OrchestratorInteractiveTest:
         """
         Run the complete interactive test workflow.
         """
-        print("🚀 ORCHESTRATOR INTERACTIVE TEST")
-        print("=" * 50)
-        print(f"Test Session ID: {self.test_session_id}")
-        print()
+        print("\n".join((
+            "🚀 ORCHESTRATOR INTERACTIVE TEST",
+            "=" * 50,
+            f"Test Session ID: {self.test_session_id}",
+            ""
+        )))
 
         try:
             # Step 1: Initialize orchestrator
@@ -100,15 +138,16 @@ class OrchestratorInteractiveTest:
             self.orchestrator = QueryOrchestrator()
             init_result = self.orchestrator.initialize()
 
-            print(f"📊 Initialization Result:")
-            print(f"   Success: {init_result['success']}")
+            print(f"📊 Initialization Result:\n   Success: {init_result['success']}")
 
             if init_result['success']:
                 components = init_result['components']
-                print(f"   ✅ CUBE Client: Connected")
-                print(f"   ✅ LLM Client: {components['llm_client']['model']}")
-                print(f"   ✅ System Prompt: {components['system_prompt']['length']} chars")
-                print(f"   ✅ Available Cubes: {components['system_prompt']['metadata']['views_count']} views")
+                print("\n".join((
+                    "   ✅ CUBE Client: Connected",
+                    f"   ✅ LLM Client: {components['llm_client']['model']}",
+                    f"   ✅ System Prompt: {components['system_prompt']['length']} chars",
+                    f"   ✅ Available Cubes: {components['system_prompt']['metadata']['views_count']} views"
+                )))
                 return True
             else:
                 print("❌ Initialization failed:")
@@ -122,16 +161,17 @@ class OrchestratorInteractiveTest:
 
     def _display_sample_questions(self):
         """Display sample questions to help user get started."""
-        print("\n📋 SAMPLE QUESTIONS ABOUT EVENT DATA")
-        print("-" * 40)
+        lines = ["\n📋 SAMPLE QUESTIONS ABOUT EVENT DATA", "-" * 40]
 
         for i, sample in enumerate(self.sample_questions, 1):
-            print(f"{i}. {sample['question']}")
-            print(f"   💡 {sample['description']}")
-            print()
+            lines.append(f"{i}. {sample['question']}")
+            lines.append(f"   💡 {sample['description']}")
+            lines.append("")
 
-        print("💭 Or ask your own question about events, revenue, tickets, or payment methods!")
-        print()
+        lines.append("💭 Or ask your own question about events, revenue, tickets, or payment methods!")
+        lines.append("")
+        # Single write for the whole block
+        print("\n".join(lines))
 
     def _get_user_input(self) -> str:
         """
@@ -140,14 +180,13 @@ class OrchestratorInteractiveTest:
         Returns:
             User query string or empty string if cancelled
         """
-        print("🤔 ENTER YOUR QUESTION")
-        print("-" * 25)
+        print("🤔 ENTER YOUR QUESTION\n" + "-" * 25)
 
         while True:
             try:
                 user_input = input("Your question about events data: ").strip()
 
-                if user_input.lower() in ['exit', 'quit', 'cancel']:
+                if user_input.lower() in CANCEL_WORDS:
                     return ""
 
                 if len(user_input) < 5:
@@ -156,9 +195,9 @@ class OrchestratorInteractiveTest:
 
                 # Confirm the question
                 print(f"\n✅ You asked: '{user_input}'")
-                confirm = input("Proceed with this question? (y/n): ").strip().lower()
+                confirm = _read_answer("Proceed with this question? (y/n): ")
 
-                if confirm in ['y', 'yes']:
+                if confirm in YES_WORDS:
                     return user_input
                 else:
                     print("Please enter your question again:")
@@ -178,15 +217,13 @@ class OrchestratorInteractiveTest:
         Returns:
             Processing result dictionary
         """
-        print(f"\n🤖 PROCESSING QUERY")
-        print("-" * 20)
-        print(f"Query: {user_query}")
+        print("\n🤖 PROCESSING QUERY\n" + "-" * 20 + f"\nQuery: {user_query}")
 
         # Process query through orchestrator
         result = self.orchestrator.process_query(user_query)
 
-        print(f"Pipeline Success: {result['success']}")
-        print(f"Response Type: {result.get('response_type', 'unknown')}")
+        print(f"Pipeline Success: {result['success']}\n"
+              f"Response Type: {result.get('response_type', 'unknown')}")
 
         # Display pipeline steps
         if 'pipeline_steps' in result:
@@ -216,8 +253,8 @@ class OrchestratorInteractiveTest:
         Args:
             result: Processing result from orchestrator
         """
-        print(f"\n📊 QUERY RESULTS")
-        print("=" * 30)
+        # Collected and written once instead of one print per line/row
+        lines = [f"\n📊 QUERY RESULTS", "=" * 30]
 
         response_type = result.get('response_type')
 
@@ -225,94 +262,124 @@ class OrchestratorInteractiveTest:
             # Successful data query
             llm_response = result.get('llm_response', {})
 
-            print(f"🎯 Query Interpretation:")
-            print(f"   {llm_response.get('interpretation', 'No interpretation available')}")
-            print()
+            lines.append(f"🎯 Query Interpretation:")
+            lines.append(f"   {llm_response.get('interpretation', 'No interpretation available')}")
+            lines.append("")
 
-            print(f"📋 Description:")
-            print(f"   {llm_response.get('description', 'No description available')}")
-            print()
+            lines.append(f"📋 Description:")
+            lines.append(f"   {llm_response.get('description', 'No description available')}")
+            lines.append("")
 
             # Display CUBE query that was executed
             cube_query = llm_response.get('cube_query', {})
-            print(f"🔍 Generated CUBE Query:")
-            print(f"   Measures: {cube_query.get('measures', [])}")
-            print(f"   Dimensions: {cube_query.get('dimensions', [])}")
+            lines.append(f"🔍 Generated CUBE Query:")
+            lines.append(f"   Measures: {cube_query.get('measures', [])}")
+            lines.append(f"   Dimensions: {cube_query.get('dimensions', [])}")
             if cube_query.get('filters'):
-                print(f"   Filters: {cube_query.get('filters', [])}")
-            print()
+                lines.append(f"   Filters: {cube_query.get('filters', [])}")
+            lines.append("")
 
             # Display data results
             cube_data = result.get('cube_data', [])
-            print(f"📈 Query Results ({result.get('row_count', 0)} rows):")
+            lines.append(f"📈 Query Results ({result.get('row_count', 0)} rows):")
 
             if cube_data:
                 # Display first few rows
                 max_display_rows = 5
                 for i, row in enumerate(cube_data[:max_display_rows]):
-                    print(f"   Row {i+1}: {row}")
+                    lines.append(f"   Row {i+1}: {self._format_row(row)}")
 
                 if len(cube_data) > max_display_rows:
-                    print(f"   ... and {len(cube_data) - max_display_rows} more rows")
+                    lines.append(f"   ... and {len(cube_data) - max_display_rows} more rows")
             else:
-                print("   No data returned")
+                lines.append("   No data returned")
 
-            print()
-            print(f"💾 Full results saved to: {result.get('csv_filename', 'N/A')}")
+            lines.append("")
+            lines.append(f"💾 Full results saved to: {result.get('csv_filename', 'N/A')}")
 
         elif response_type == "clarification":
             # LLM needs clarification
             llm_response = result.get('llm_response', {})
 
-            print(f"❓ Clarification Needed:")
-            print(f"   {llm_response.get('interpretation', 'Need more information')}")
-            print()
+            lines.append(f"❓ Clarification Needed:")
+            lines.append(f"   {llm_response.get('interpretation', 'Need more information')}")
+            lines.append("")
 
             questions = llm_response.get('clarification_questions', [])
             if questions:
-                print(f"❓ Please clarify:")
+                lines.append(f"❓ Please clarify:")
                 for i, question in enumerate(questions, 1):
-                    print(f"   {i}. {question}")
-                print()
+                    lines.append(f"   {i}. {question}")
+                lines.append("")
 
             suggestions = llm_response.get('suggestions', [])
             if suggestions:
-                print(f"💡 Suggestions:")
+                lines.append(f"💡 Suggestions:")
                 for suggestion in suggestions:
-                    print(f"   - {suggestion}")
+                    lines.append(f"   - {suggestion}")
 
         elif response_type == "cube_error":
             # CUBE execution failed
-            print(f"❌ CUBE Query Error:")
+            lines.append(f"❌ CUBE Query Error:")
             cube_error = result.get('cube_error', {})
-            print(f"   Error: {cube_error.get('error', 'Unknown error')}")
-            print(f"   Details: {cube_error.get('details', 'No details available')}")
+            lines.append(f"   Error: {cube_error.get('error', 'Unknown error')}")
+            lines.append(f"   Details: {cube_error.get('details', 'No details available')}")
 
         else:
             # Other error types
-            print(f"❌ Processing Error:")
-            print(f"   Type: {response_type}")
-            print(f"   Error: {result.get('error', 'Unknown error')}")
+            lines.append(f"❌ Processing Error:")
+            lines.append(f"   Type: {response_type}")
+            lines.append(f"   Error: {result.get('error', 'Unknown error')}")
+
+        print("\n".join(lines))
+
+    @staticmethod
+    def _format_row(row: dict) -> str:
+        """
+        Format a result row for preview, truncating long values.
+
+        Args:
+            row: Result row keyed by CUBE member name
+
+        Returns:
+            Row as "member=value | ..." string
+        """
+        cells = []
+        for column, value in row.items():
+            text = str(value)
+            if len(text) > MAX_PREVIEW_VALUE_CHARS:
+                text = text[:MAX_PREVIEW_VALUE_CHARS] + "..."
+            cells.append(f"{column}={text}")
+        return " | ".join(cells)
 
     def _handle_follow_up(self):
-        """Handle follow-up questions or conversation continuation."""
-        print(f"\n🔄 FOLLOW-UP OPTIONS")
-        print("-" * 25)
+        """
+        Handle follow-up questions until the user stops.
 
+        All follow-ups go through the same orchestrator, so the system prompt,
+        clients and conversation history are reused instead of restarting.
+        """
         try:
-            # Show conversation history
-            history = self.orchestrator.get_conversation_history()
-            print(f"📜 Conversation: {len(history)} messages in history")
+            while True:
+                print("\n🔄 FOLLOW-UP OPTIONS\n" + "-" * 25)
+
+                # Show conversation history
+                history = self.orchestrator.get_conversation_history()
+                print(f"📜 Conversation: {len(history)} messages in history")
 
-            follow_up = input("\nAsk another question? (y/n): ").strip().lower()
+                follow_up = _read_answer("\nAsk another question? (y/n): ")
+
+                if follow_up not in YES_WORDS:
+                    break
 
-            if follow_up in ['y', 'yes']:
                 print("\n" + "="*50)
                 follow_up_query = self._get_user_input()
 
-                if follow_up_query:
-                    follow_up_result = self._process_user_query(follow_up_query)
-                    self._display_results(follow_up_result)
+                if not follow_up_query:
+                    break
+
+                follow_up_result = self._process_user_query(follow_up_query)
+                self._display_results(follow_up_result)
 
         except KeyboardInterrupt:
             print("\n\n💬 Conversation ended by user")
@@ -320,18 +387,22 @@ class OrchestratorInteractiveTest:
     def get_orchestrator_status(self):
         """Display current orchestrator status for debugging."""
         if self.orchestrator:
-            status = self.orchestrator.get_status()
-            print(f"\n🔍 ORCHESTRATOR STATUS")
-            print("-" * 30)
-            print(json.dumps(status, indent=2))
+            status = self.orchestrator.get_status(depth="full")
+            print("\n🔍 ORCHESTRATOR STATUS\n" + "-" * 30)
+            print(self._format_status(status))
+
+    @staticmethod
+    def _format_status(status: dict) -> str:
+        """Format the status dict as indented JSON."""
+        return orjson.dumps(status, option=orjson.OPT_INDENT_2 | orjson.OPT_NON_STR_KEYS).decode()
 
 
 def main():
     """
     Run the interactive orchestrator test.
     """
-    print("🎯 Starting Interactive Orchestrator Test")
-    print("This test will walk you through the complete query pipeline.\n")
+    print("🎯 Starting Interactive Orchestrator Test\n"
+          "This test will walk you through the complete query pipeline.\n")
 
     test = OrchestratorInteractiveTest()
     success = test.run_interactive_test()